@@ -32,6 +32,9 @@ class ConfigService:
         "export_quality": 95,
         "auto_lod": True,
         "max_preview_points": 10000,
+        "cache_dir": "",
+        "cache_max_entries": 32,
+        "cache_disk_limit_mb": 2048,
     }
 
     # Non-persistent constants
@@ -42,6 +45,10 @@ class ConfigService:
     def __init__(self):
         """Initialize the Configuration Service with QgsSettings."""
         self.settings = QgsSettings()
+        # Expected Python type of each known setting, derived from DEFAULTS
+        self._types: dict[str, type] = {k: type(v) for k, v in self.DEFAULTS.items()}
+        # Local cache of resolved values to avoid repeated QgsSettings lookups
+        self._cache: dict[str, Any] = {}
 
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieve a configuration value by key.
@@ -53,17 +60,53 @@ class ConfigService:
         Returns:
             The configuration value from settings or its default value.
         """
+        if key in self._cache:
+            return self._cache[key]
+
         full_key = self.PREFIX + key
 
         # Determine internal default
-        if default is None:
+        use_internal_default = default is None
+        if use_internal_default:
             default = self.DEFAULTS.get(key)
 
         value = self.settings.value(full_key, default)
 
         # Handle type conversion if necessary (QgsSettings can return QVariant)
+        value = self._coerce(key, value)
+
+        # Only cache values resolved against the internal defaults so that a
+        # caller-provided fallback never leaks into later lookups.
+        if use_internal_default:
+            self._cache[key] = value
         return value
 
+    def _coerce(self, key: str, value: Any) -> Any:
+        """Convert a raw settings value to the type of its default.
+
+        Args:
+            key: The configuration key (without prefix).
+            value: The raw value returned by QgsSettings.
+
+        Returns:
+            The value converted to the expected type, or unchanged if the key
+            is unknown or the conversion fails.
+        """
+        expected = self._types.get(key)
+        if expected is None or value is None or isinstance(value, expected):
+            return value
+
+        try:
+            if expected is bool:
+                # QgsSettings may store booleans as "true"/"false" strings
+                if isinstance(value, str):
+                    return value.strip().lower() in ("true", "1", "yes")
+                return bool(value)
+            return expected(value)
+        except (TypeError, ValueError):
+            logger.warning(f"Could not convert setting '{key}' value {value!r} to {expected.__name__}")
+            return value
+
     def set(self, key: str, value: Any) -> None:
         """Store a configuration value.
 
@@ -73,10 +116,12 @@ class ConfigService:
         """
         full_key = self.PREFIX + key
         self.settings.setValue(full_key, value)
+        self._cache[key] = self._coerce(key, value)
         logger.debug(f"Config set: {full_key} = {value}")
 
     def reset_defaults(self) -> None:
         """Reset all known persistent settings to their default values."""
+        self._cache.clear()
         for key, value in self.DEFAULTS.items():
             self.set(key, value)
         logger.info("Configuration reset to defaults")
@@ -7,54 +7,182 @@ This module handles the orchestration of various data generation services
 (topography, geology, structures, drillholes) and manages result caching.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache, partial
+import logging
 import math
 from pathlib import Path
 import time
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from sec_interp.core import utils as scu
 from sec_interp.core.config import ConfigService
-from sec_interp.core.data_cache import DataCache
+from sec_interp.core.data_cache import EMPTY_RESULT, PersistentDataCache
 from sec_interp.core.exceptions import DataMissingError, ProcessingError
-from sec_interp.core.services import (
-    DrillholeService,
-    GeologyService,
-    ProfileService,
-    StructureService,
-)
-from sec_interp.core.types import PreviewParams
+from sec_interp.core.types import PreviewParams, has_persistent_identity
 from sec_interp.logger_config import get_logger
 
 
+if TYPE_CHECKING:
+    from sec_interp.core.services import (
+        DrillholeService,
+        GeologyService,
+        ProfileService,
+        StructureService,
+    )
+
 logger = get_logger(__name__)
 
+# Status message kept as a %-style (template, args) pair until displayed
+StatusMessage = tuple[str, tuple]
+
+
+def format_messages(messages: list[StatusMessage]) -> list[str]:
+    """Render status messages returned by `generate_profile_data`.
+
+    Args:
+        messages: Unformatted (template, args) message pairs.
+
+    Returns:
+        The formatted, human-readable messages.
+    """
+    return [template % args if args else template for template, args in messages]
+
+
+@lru_cache(maxsize=None)
+def _get_config_service() -> ConfigService:
+    """Return the process-wide configuration service."""
+    return ConfigService()
+
+
+@lru_cache(maxsize=None)
+def _get_data_cache() -> PersistentDataCache:
+    """Return the process-wide data cache shared by all controllers."""
+    config = _get_config_service()
+    return PersistentDataCache(
+        _resolve_cache_dir(config),
+        max_entries=config.get("cache_max_entries"),
+        size_limit=config.get("cache_disk_limit_mb") * 1024 * 1024,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_io_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor used for background layer reads."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="sec_interp_io")
+
+
+def _resolve_cache_dir(config: ConfigService) -> Path:
+    """Return the on-disk cache directory from settings or the QGIS profile.
+
+    Args:
+        config: Configuration service to read the 'cache_dir' setting from.
+
+    Returns:
+        Path to the directory used by the persistent cache tier.
+    """
+    cache_dir = config.get("cache_dir")
+    if cache_dir:
+        return Path(cache_dir)
+
+    from qgis.core import QgsApplication
+
+    return Path(QgsApplication.qgisSettingsDirPath()) / "sec_interp_cache"
+
+
+# IDs of layers whose dataChanged signal already invalidates the shared cache
+_connected_layer_ids: set[str] = set()
+
+# PreviewParams layer attributes each cached phase depends on
+_PHASE_LAYER_ATTRS = {
+    "topo": ("raster_layer", "line_layer"),
+    "geol": ("raster_layer", "line_layer", "outcrop_layer"),
+    "geol_isect": ("line_layer", "outcrop_layer"),
+    "struct": ("raster_layer", "line_layer", "struct_layer"),
+    "drill": (
+        "raster_layer", "line_layer", "collar_layer", "survey_layer", "interval_layer",
+    ),
+}
+
 
 class ProfileController:
     """Orchestrates data generation services for SecInterp profile creation."""
 
     def __init__(self):
         """Initialize services and the data cache."""
-        self.config_service = ConfigService()
-        self.data_cache = DataCache()
-        self.profile_service = ProfileService()
-        self.geology_service = GeologyService()
-        self.structure_service = StructureService()
-        self.drillhole_service = DrillholeService()
+        # Shared across controllers so cache hits survive dialog re-creation
+        self.config_service = _get_config_service()
+        self.data_cache = _get_data_cache()
+        # Executor for background layer reads, also used by the preview service
+        self.io_executor = _get_io_executor()
         logger.debug("ProfileController initialized")
 
+    # Services are built on first use so unused phases cost nothing
+
+    @cached_property
+    def profile_service(self) -> ProfileService:
+        """Topographic profile service."""
+        from sec_interp.core.services.profile_service import ProfileService
+
+        return ProfileService()
+
+    @cached_property
+    def geology_service(self) -> GeologyService:
+        """Geological profile service."""
+        from sec_interp.core.services.geology_service import GeologyService
+
+        return GeologyService()
+
+    @cached_property
+    def structure_service(self) -> StructureService:
+        """Structural projection service."""
+        from sec_interp.core.services.structure_service import StructureService
+
+        return StructureService()
+
+    @cached_property
+    def drillhole_service(self) -> DrillholeService:
+        """Drillhole desurveying and projection service."""
+        from sec_interp.core.services.drillhole_service import DrillholeService
+
+        return DrillholeService()
+
     def connect_layer_notifications(self, layers: list[Any]) -> None:
         """Connect to layer signals for automatic cache invalidation on data changes.
 
+        Only cache entries that depend on the changed layer are dropped. When a
+        layer is removed from the project its entries are dropped as well.
+
         Args:
             layers: List of QgsMapLayer objects to monitor.
         """
         for layer in layers:
-            if not layer:
+            if not layer or layer.id() in _connected_layer_ids:
                 continue
-            # When layer data changes, clear cache for its bucket or altogether
-            layer.dataChanged.connect(self.data_cache.clear)
+            layer_id = layer.id()
+            layer.dataChanged.connect(partial(self._on_layer_changed, layer_id))
+            layer.willBeDeleted.connect(partial(self._on_layer_deleted, layer_id))
+            _connected_layer_ids.add(layer_id)
             logger.debug(f"Connected cache invalidation to layer: {layer.name()}")
 
+    def _on_layer_changed(self, layer_id: str) -> None:
+        """Drop cached results and collar indexes built from a changed layer.
+
+        Args:
+            layer_id: ID of the layer whose data changed.
+        """
+        self.data_cache.invalidate_layer(layer_id)
+        self.drillhole_service.invalidate_collar_index(layer_id)
+
+    def _on_layer_deleted(self, layer_id: str) -> None:
+        """Drop cache entries and signal bookkeeping for a removed layer.
+
+        Args:
+            layer_id: ID of the layer about to be deleted.
+        """
+        self._on_layer_changed(layer_id)
+        _connected_layer_ids.discard(layer_id)
+
     def get_cached_data(self, inputs: dict[str, Any]) -> Optional[dict[str, Any]]:
         """Retrieve data from cache if available for the given inputs.
 
@@ -79,11 +207,13 @@ class ProfileController:
 
     def generate_profile_data(
         self, params: PreviewParams
-    ) -> tuple[list, Any, Any, Any, list[str]]:
+    ) -> tuple[list, Any, Any, Any, list[StatusMessage]]:
         """Unified method to generate all profile data components with granular caching.
 
         Orchestrates topography sampling, geology intersection, structural projection,
-        and drillhole desurveying.
+        and drillhole desurveying. All phases run on the calling thread, which
+        must own the layers: QGIS layers, their data providers and processing
+        algorithms are not thread-safe.
 
         Args:
             params: Validated input parameters for preview generation.
@@ -94,7 +224,8 @@ class ProfileController:
                 - geol_data: List of GeologySegment objects.
                 - struct_data: List of StructureMeasurement objects.
                 - drillhole_data: Drillhole projection result object.
-                - messages: List of status or warning messages for the user.
+                - messages: Unformatted status or warning messages for the
+                  user; render them with `format_messages`.
 
         Raises:
             ProcessingError: If critical data (like topography) cannot be generated.
@@ -111,175 +242,451 @@ class ProfileController:
             "timestamp": time.time(),
         }
 
-        # Cache key helpers updated to use params attributes
-        def get_sub_key(param_values: list[Any]) -> str:
-            # Simple hash for a subset of parameters
-            import hashlib
-            hasher = hashlib.md5()
-            for val in param_values:
-                from qgis.core import QgsMapLayer
-                if isinstance(val, QgsMapLayer):
-                    hasher.update(val.id().encode("utf-8"))
-                else:
-                    hasher.update(str(val).encode("utf-8"))
-            return hasher.hexdigest()
-
-        raster_layer = params.raster_layer
-        line_layer = params.line_layer
-        outcrop_layer = params.outcrop_layer
-        structural_layer = params.struct_layer
-        selected_band = params.band_num
-        buffer_dist = params.buffer_dist
-
         # 1. Topography
-        topo_key = get_sub_key(["selected_band", "max_points"])
-        profile_data = self.data_cache.get("topo", topo_key)
-        if profile_data:
-            logger.debug("Cache hit: Topography")
+        profile_data = self._generate_topography(params, cache_meta)
+        messages.append(
+            ("✓ Data processed successfully!\n\nTopography: %d points", (len(profile_data),))
+        )
+
+        # Section geometry shared by the geology, structure and drillhole phases
+        line_geom = None
+        needs_line = (
+            (params.outcrop_layer and params.outcrop_name_field)
+            or (params.struct_layer and params.dip_field and params.strike_field)
+            or (params.collar_layer and params.survey_layer and params.interval_layer)
+        )
+        if needs_line:
+            line_geom = params.line_geometry
+
+        # 2-4. Geology, structures and drillholes
+        results = self._run_phases(params, cache_meta, line_geom)
+
+        phase_data = {}
+        for name in ("geol", "struct", "drill"):
+            data, phase_messages = results.get(name, (None, []))
+            phase_data[name] = data
+            messages.extend(phase_messages)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for template, args in messages:
+                logger.debug(template, *args)
+
+        # Adapt bucket sizes to observed hit rates off the UI thread
+        self.io_executor.submit(self.data_cache.rebalance)
+
+        return (
+            profile_data,
+            phase_data["geol"],
+            phase_data["struct"],
+            phase_data["drill"],
+            messages,
+        )
+
+    def _cache_get(self, bucket: str, key: str, params: PreviewParams) -> Any:
+        """Fetch a phase result, rejecting entries stored for other inputs.
+
+        Args:
+            bucket: Cache bucket name.
+            key: Sub-key identifying the phase inputs.
+            params: Parameters the result must have been generated from.
+
+        Returns:
+            The cached result, or None on a miss or key collision.
+        """
+        return self.data_cache.get(bucket, key, params.key_fingerprints[bucket])
+
+    def _cache_set(
+        self,
+        bucket: str,
+        key: str,
+        data: Any,
+        metadata: dict,
+        params: PreviewParams,
+    ) -> None:
+        """Store a phase result in the data cache.
+
+        Args:
+            bucket: Cache bucket name.
+            key: Sub-key identifying the phase inputs.
+            data: Result to cache.
+            metadata: Cache metadata (LOD info).
+            params: Parameters the result was generated from.
+        """
+        self.data_cache.set(
+            bucket,
+            key,
+            data,
+            self._cache_metadata(bucket, metadata, params),
+            params.key_fingerprints[bucket],
+        )
+
+    def _cache_get_or_compute(
+        self,
+        bucket: str,
+        key: str,
+        factory: Callable[[], Any],
+        metadata: dict,
+        params: PreviewParams,
+    ) -> Any:
+        """Fetch a phase result, computing it once on a miss.
+
+        Concurrent previews missing on the same entry share one computation.
+        An empty result is cached as EMPTY_RESULT.
+
+        Args:
+            bucket: Cache bucket name.
+            key: Sub-key identifying the phase inputs.
+            factory: Computes the result.
+            metadata: Cache metadata (LOD info).
+            params: Parameters the result is generated from.
+
+        Returns:
+            The cached or freshly computed result, or EMPTY_RESULT.
+        """
+        return self.data_cache.get_or_compute(
+            bucket,
+            key,
+            lambda: factory() or EMPTY_RESULT,
+            self._cache_metadata(bucket, metadata, params),
+            params.key_fingerprints[bucket],
+        )
+
+    @staticmethod
+    def _cache_metadata(bucket: str, metadata: dict, params: PreviewParams) -> dict:
+        """Return entry metadata recording the layers a phase reads.
+
+        The IDs of the layers are recorded so that edits to one layer only
+        invalidate dependent entries. Entries are only persisted when every
+        layer has a file source without unsaved edits.
+
+        Args:
+            bucket: Cache bucket name.
+            metadata: Cache metadata (LOD info).
+            params: Parameters the result is generated from.
+
+        Returns:
+            A copy of ``metadata`` with a ``layer_ids`` list and a
+            ``persist`` flag added.
+        """
+        layers = [getattr(params, attr) for attr in _PHASE_LAYER_ATTRS[bucket]]
+        layers = [layer for layer in layers if layer]
+        return {
+            **metadata,
+            "layer_ids": [layer.id() for layer in layers],
+            "persist": all(has_persistent_identity(layer) for layer in layers),
+        }
+
+    def _run_phases(
+        self,
+        params: PreviewParams,
+        cache_meta: dict[str, Any],
+        line_geom: Optional[Any],
+    ) -> dict[str, tuple[Any, list[StatusMessage]]]:
+        """Run the enabled non-topographic phases in order.
+
+        Args:
+            params: Validated input parameters for preview generation.
+            cache_meta: Metadata attached to cached entries.
+            line_geom: Section line geometry, read once for all phases.
+
+        Returns:
+            Dictionary mapping phase name ('geol', 'struct', 'drill') to a
+            ``(data, messages)`` tuple.
+        """
+        line_azimuth = None
+        if line_geom and not line_geom.isNull():
+            line_azimuth = scu.calculate_line_azimuth(line_geom)
         else:
-            profile_data = self.profile_service.generate_topographic_profile(
-                line_layer, raster_layer, selected_band
-            )
-            if not profile_data:
-                raise ProcessingError("No topographic profile data was generated.")
-            self.data_cache.set("topo", topo_key, profile_data, cache_meta)
+            line_geom = None
+
+        tasks = []
+        if params.outcrop_layer:
+            tasks.append(("geol", partial(self._generate_geology, params, cache_meta, line_geom)))
+        if params.struct_layer:
+            tasks.append((
+                "struct",
+                partial(self._generate_structures, params, cache_meta, line_geom, line_azimuth),
+            ))
+        if params.collar_layer:
+            tasks.append((
+                "drill",
+                partial(self._generate_drillholes, params, cache_meta, line_geom, line_azimuth),
+            ))
+
+        return {name: func() for name, func in tasks}
+
+    def _generate_topography(
+        self, params: PreviewParams, cache_meta: dict[str, Any]
+    ) -> list:
+        """Generate (or fetch from cache) the topographic profile.
 
-        messages.append(
-            f"✓ Data processed successfully!\n\nTopography: {len(profile_data)} points"
+        Args:
+            params: Validated input parameters for preview generation.
+            cache_meta: Metadata attached to cached entries.
+
+        Returns:
+            List of topographic points (distance, elevation).
+
+        Raises:
+            ProcessingError: If no topographic data could be generated.
+        """
+        return self._cache_get_or_compute(
+            "topo",
+            params.topo_key,
+            partial(self._compute_topography, params),
+            cache_meta,
+            params,
+        )
+
+    def _compute_topography(self, params: PreviewParams) -> Any:
+        """Sample the topographic profile along the section line.
+
+        Args:
+            params: Validated input parameters for preview generation.
+
+        Returns:
+            The topographic profile.
+
+        Raises:
+            ProcessingError: If no topographic data could be generated.
+        """
+        profile_data = self.profile_service.generate_topographic_profile(
+            params.line_layer, params.raster_layer, params.band_num
+        )
+        if not profile_data:
+            raise ProcessingError("No topographic profile data was generated.")
+        return profile_data
+
+    def _generate_geology(
+        self, params: PreviewParams, cache_meta: dict[str, Any], line_geom: Optional[Any]
+    ) -> tuple[Any, list[StatusMessage]]:
+        """Generate (or fetch from cache) the geological profile.
+
+        Args:
+            params: Validated input parameters for preview generation.
+            cache_meta: Metadata attached to cached entries.
+            line_geom: Valid section line geometry, or None if unavailable.
+
+        Returns:
+            Tuple of (geology segments or None, status messages).
+        """
+        outcrop_name_field = params.outcrop_name_field
+        if not outcrop_name_field:
+            return None, [("\n⚠ Outcrop layer selected but no geology field specified.", ())]
+        if not line_geom:
+            return None, []
+
+        geol_key = params.geol_key
+        geol_data = self._cache_get("geol", geol_key, params)
+        if geol_data is EMPTY_RESULT:
+            logger.debug("Cache hit: Geology (no intersections)")
+            return None, [("Geology: No intersections", ())]
+        if geol_data:
+            logger.debug("Cache hit: Geology")
+            return geol_data, []
+
+        line_start = scu.get_line_start_point(line_geom)
+
+        # The line/outcrop intersection does not depend on the DEM band, so it
+        # is cached separately and reused when only the elevations change
+        intersections = self._cache_get_or_compute(
+            "geol_isect",
+            params.geol_isect_key,
+            partial(
+                self.geology_service.compute_intersections,
+                params.line_layer,
+                line_start,
+                params.outcrop_layer,
+                outcrop_name_field,
+            ),
+            cache_meta,
+            params,
         )
 
-        # 2. Geology
         geol_data = None
-        if outcrop_layer:
-            geol_key = get_sub_key([params.outcrop_layer, params.outcrop_name_field, params.band_num])
-            geol_data = self.data_cache.get("geol", geol_key)
-            if geol_data:
-                logger.debug("Cache hit: Geology")
-            else:
-                outcrop_name_field = params.outcrop_name_field
-                if outcrop_name_field:
-                    geol_data = self.geology_service.generate_geological_profile(
-                        line_layer,
-                        raster_layer,
-                        outcrop_layer,
-                        outcrop_name_field,
-                        selected_band,
-                    )
-                    if geol_data:
-                        self.data_cache.set("geol", geol_key, geol_data, cache_meta)
-                        messages.append(f"Geology: {len(geol_data)} segments")
-                    else:
-                        messages.append("Geology: No intersections")
-                else:
-                    messages.append("\n⚠ Outcrop layer selected but no geology field specified.")
-
-        # 3. Structure
-        struct_data = None
-        if structural_layer:
-            struct_key = get_sub_key([
-                params.struct_layer, params.buffer_dist, params.dip_field,
-                params.strike_field, params.band_num
-            ])
-            struct_data = self.data_cache.get("struct", struct_key)
-            if struct_data:
-                logger.debug("Cache hit: Structure")
-            else:
-                dip_field = params.dip_field
-                strike_field = params.strike_field
-
-                if dip_field and strike_field:
-                    line_feat = next(line_layer.getFeatures(), None)
-                    if line_feat:
-                        line_geom = line_feat.geometry()
-                        if line_geom and not line_geom.isNull():
-                            line_azimuth = scu.calculate_line_azimuth(line_geom)
-                            struct_data = self.structure_service.project_structures(
-                                line_layer,
-                                raster_layer,
-                                structural_layer,
-                                buffer_dist,
-                                line_azimuth,
-                                dip_field,
-                                strike_field,
-                                selected_band,
-                            )
-
-                            if struct_data:
-                                self.data_cache.set("struct", struct_key, struct_data, cache_meta)
-                                messages.append(f"Structures: {len(struct_data)} points")
-                            else:
-                                messages.append(f"Structures: None in {buffer_dist}m buffer")
-                    else:
-                        messages.append("\n⚠ Structural layer selected but dip/strike fields not specified.")
-
-        # 4. Drillholes
-        drillhole_data = None
+        if intersections is not EMPTY_RESULT:
+            geol_data = self.geology_service.sample_elevations(
+                params.line_layer,
+                line_geom,
+                line_start,
+                params.raster_layer,
+                intersections,
+                params.band_num,
+            )
+        if not geol_data:
+            self._cache_set("geol", geol_key, EMPTY_RESULT, cache_meta, params)
+            return None, [("Geology: No intersections", ())]
+
+        self._cache_set("geol", geol_key, geol_data, cache_meta, params)
+        return geol_data, [("Geology: %d segments", (len(geol_data),))]
+
+    def _generate_structures(
+        self,
+        params: PreviewParams,
+        cache_meta: dict[str, Any],
+        line_geom: Optional[Any],
+        line_azimuth: Optional[float],
+    ) -> tuple[Any, list[StatusMessage]]:
+        """Generate (or fetch from cache) the projected structural measurements.
+
+        Args:
+            params: Validated input parameters for preview generation.
+            cache_meta: Metadata attached to cached entries.
+            line_geom: Valid section line geometry, or None if unavailable.
+            line_azimuth: Azimuth of the section line in degrees.
+
+        Returns:
+            Tuple of (structure measurements or None, status messages).
+        """
+        dip_field = params.dip_field
+        strike_field = params.strike_field
+        if not dip_field or not strike_field:
+            return None, [("\n⚠ Structural layer selected but dip/strike fields not specified.", ())]
+        if not line_geom:
+            return None, []
+
+        buffer_dist = params.buffer_dist
+        struct_key = params.struct_key
+        struct_data = self._cache_get("struct", struct_key, params)
+        if struct_data is EMPTY_RESULT:
+            logger.debug("Cache hit: Structure (none in buffer)")
+            return None, [("Structures: None in %sm buffer", (buffer_dist,))]
+        if struct_data:
+            logger.debug("Cache hit: Structure")
+            return struct_data, []
+
+        struct_data = self.structure_service.project_structures(
+            params.line_layer,
+            params.raster_layer,
+            params.struct_layer,
+            buffer_dist,
+            line_azimuth,
+            dip_field,
+            strike_field,
+            params.band_num,
+        )
+        if not struct_data:
+            self._cache_set("struct", struct_key, EMPTY_RESULT, cache_meta, params)
+            return None, [("Structures: None in %sm buffer", (buffer_dist,))]
+
+        self._cache_set("struct", struct_key, struct_data, cache_meta, params)
+        return struct_data, [("Structures: %d points", (len(struct_data),))]
+
+    def _generate_drillholes(
+        self,
+        params: PreviewParams,
+        cache_meta: dict[str, Any],
+        line_geom: Optional[Any],
+        line_azimuth: Optional[float],
+    ) -> tuple[Any, list[StatusMessage]]:
+        """Generate (or fetch from cache) the projected drillhole data.
+
+        Args:
+            params: Validated input parameters for preview generation.
+            cache_meta: Metadata attached to cached entries.
+            line_geom: Valid section line geometry, or None if unavailable.
+            line_azimuth: Azimuth of the section line in degrees.
+
+        Returns:
+            Tuple of (drillhole data or None, status messages).
+        """
+        # Only traces with survey and interval data are returned, so skip
+        # projecting collars that would be discarded
+        if not line_geom or not (params.survey_layer and params.interval_layer):
+            return None, []
+
+        drillhole_data = self._cache_get_or_compute(
+            "drill",
+            params.drill_key,
+            partial(self._compute_drillholes, params, line_geom, line_azimuth),
+            cache_meta,
+            params,
+        )
+        if drillhole_data is EMPTY_RESULT:
+            return None, []
+        return drillhole_data, []
+
+    def _compute_drillholes(
+        self, params: PreviewParams, line_geom: Any, line_azimuth: Optional[float]
+    ) -> Any:
+        """Project collars and desurvey drillholes onto the section.
+
+        Args:
+            params: Validated input parameters for preview generation.
+            line_geom: Valid section line geometry.
+            line_azimuth: Azimuth of the section line in degrees.
+
+        Returns:
+            The drillhole traces, or None if no collars were projected.
+        """
+        line_layer = params.line_layer
         collar_layer = params.collar_layer
-        if collar_layer:
-            drill_key = get_sub_key([
-                params.collar_layer, params.survey_layer, params.interval_layer,
-                params.buffer_dist, params.collar_id_field, params.survey_id_field, params.interval_id_field
-            ])
-            drillhole_data = self.data_cache.get("drill", drill_key)
-            if drillhole_data:
-                logger.debug("Cache hit: Drillholes")
-            else:
-                # Derive required components
-                line_feat = next(line_layer.getFeatures(), None)
-                if line_feat:
-                    section_geom = line_feat.geometry()
-                    section_start = scu.get_line_vertices(section_geom)[0]
-                    distance_area = scu.create_distance_area(line_layer.crs())
-
-                    # Project Collars
-                    collars = self.drillhole_service.project_collars(
-                        collar_layer=collar_layer,
-                        line_geom=section_geom,
-                        line_start=section_start,
-                        distance_area=distance_area,
-                        buffer_width=buffer_dist,
-                        collar_id_field=params.collar_id_field,
-                        use_geometry=params.collar_use_geometry,
-                        collar_x_field=params.collar_x_field,
-                        collar_y_field=params.collar_y_field,
-                        collar_z_field=params.collar_z_field,
-                        collar_depth_field=params.collar_depth_field,
-                        dem_layer=raster_layer,
-                        line_crs=line_layer.crs(),
-                    )
-
-                    if collars:
-                        # Process Intervals if survey/interval layers exist
-                        survey_layer = params.survey_layer
-                        interval_layer = params.interval_layer
-
-                        if survey_layer and interval_layer:
-                            section_azimuth = scu.calculate_line_azimuth(section_geom)
-                            _, drillhole_data = self.drillhole_service.process_intervals(
-                                collar_points=collars,
-                                collar_layer=collar_layer,
-                                survey_layer=survey_layer,
-                                interval_layer=interval_layer,
-                                collar_id_field=params.collar_id_field,
-                                use_geometry=params.collar_use_geometry,
-                                collar_x_field=params.collar_x_field,
-                                collar_y_field=params.collar_y_field,
-                                line_geom=section_geom,
-                                line_start=section_start,
-                                distance_area=distance_area,
-                                buffer_width=buffer_dist,
-                                section_azimuth=section_azimuth,
-                                survey_fields={
-                                    "id": params.survey_id_field,
-                                    "depth": params.survey_depth_field,
-                                    "azim": params.survey_azim_field,
-                                    "incl": params.survey_incl_field,
-                                },
-                                interval_fields={
-                                    "id": params.interval_id_field,
-                                    "from": params.interval_from_field,
-                                    "to": params.interval_to_field,
-                                    "lith": params.interval_lith_field,
-                                },
-                            )
-        return profile_data, geol_data, struct_data, drillhole_data, messages
+        buffer_dist = params.buffer_dist
+        section_start = scu.get_line_vertices(line_geom)[0]
+        distance_area = scu.create_distance_area(line_layer.crs())
+
+        survey_fields = {
+            "id": params.survey_id_field,
+            "depth": params.survey_depth_field,
+            "azim": params.survey_azim_field,
+            "incl": params.survey_incl_field,
+        }
+        interval_fields = {
+            "id": params.interval_id_field,
+            "from": params.interval_from_field,
+            "to": params.interval_to_field,
+            "lith": params.interval_lith_field,
+        }
+
+        # Survey and interval reads do not depend on the collars, so let them
+        # run while the collars are projected
+        future_surveys, future_intervals = self.drillhole_service.preload_tables(
+            self.io_executor,
+            params.survey_layer,
+            params.interval_layer,
+            survey_fields,
+            interval_fields,
+        )
+
+        # Project Collars
+        try:
+            collars, collar_coords = self.drillhole_service.project_collars(
+                collar_layer=collar_layer,
+                line_geom=line_geom,
+                line_start=section_start,
+                distance_area=distance_area,
+                buffer_width=buffer_dist,
+                collar_id_field=params.collar_id_field,
+                use_geometry=params.collar_use_geometry,
+                collar_x_field=params.collar_x_field,
+                collar_y_field=params.collar_y_field,
+                collar_z_field=params.collar_z_field,
+                collar_depth_field=params.collar_depth_field,
+                dem_layer=params.raster_layer,
+                line_crs=line_layer.crs(),
+            )
+        except Exception:
+            future_surveys.cancel()
+            future_intervals.cancel()
+            raise
+
+        drillhole_data = None
+        if len(collars):
+            _, drillhole_data = self.drillhole_service.process_intervals(
+                collar_points=collars,
+                collar_coords=collar_coords,
+                survey_features=future_surveys.result(),
+                interval_features=future_intervals.result(),
+                line_geom=line_geom,
+                line_start=section_start,
+                distance_area=distance_area,
+                buffer_width=buffer_dist,
+                section_azimuth=line_azimuth,
+                survey_fields=survey_fields,
+                interval_fields=interval_fields,
+            )
+        else:
+            future_surveys.cancel()
+            future_intervals.cancel()
+
+        return drillhole_data
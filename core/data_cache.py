@@ -1,86 +1,309 @@
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Hashable
+import contextlib
 import hashlib
+import heapq
+import itertools
+import logging
+import os
+from pathlib import Path
+import pickle
+import sys
+import threading
 import time
 from typing import Any, Optional
+import weakref
+
+import numpy as np
+from qgis.core import QgsMapLayer
 
 from sec_interp.core.interfaces.cache_interface import ICacheService
+from sec_interp.core.types import ProfileArray, layer_identity
 from sec_interp.logger_config import get_logger
 
 
 logger = get_logger(__name__)
 
+try:
+    import zstandard
+
+    _ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+    _ZSTD_DECOMPRESSOR = zstandard.ZstdDecompressor()
+
+    def _compress(data: bytes) -> bytes:
+        return _ZSTD_COMPRESSOR.compress(data)
+
+    def _decompress(data: bytes) -> bytes:
+        return _ZSTD_DECOMPRESSOR.decompress(data)
+
+    _DISK_SUFFIX = ".zpkl"
+except ImportError:
+    # Fallback without zstandard
+    import zlib
+
+    def _compress(data: bytes) -> bytes:
+        return zlib.compress(data, 3)
+
+    def _decompress(data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+    _DISK_SUFFIX = ".zlpkl"
+
+
+# Profiles at least this large are kept on disk as memory-mapped arrays
+_MMAP_MIN_BYTES = 64 * 1024
+
+# Suffix of the metadata sidecar written next to each disk entry
+_META_SUFFIX = ".meta"
+
+
+def _key_label(key: Hashable) -> str:
+    """Return a printable form of a cache key for logs and file names.
+
+    String keys are used as-is; tuple keys from `DataCache.get_cache_key`
+    are reduced to a stable digest, since ``hash()`` is salted per process.
+    """
+    if isinstance(key, str):
+        return key
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+# Dialog parameters in the order they appear in `DataCache.get_cache_key` keys
+_KEY_FIELDS = (
+    "raster_layer",
+    "selected_band",
+    "scale",
+    "vertexag",
+    "crossline_layer",
+    "buffer_distance",
+    "outcrop_layer",
+    "outcrop_name_field",
+    "structural_layer",
+    "dip_field",
+    "strike_field",
+    "dip_scale_factor",
+    "collar_layer_obj",
+    "collar_id_field",
+    "collar_use_geometry",
+    "collar_x_field",
+    "collar_y_field",
+    "collar_z_field",
+    "collar_depth_field",
+    "survey_layer_obj",
+    "survey_id_field",
+    "survey_depth_field",
+    "survey_azim_field",
+    "survey_incl_field",
+    "interval_layer_obj",
+    "interval_id_field",
+    "interval_from_field",
+    "interval_to_field",
+    "interval_lith_field",
+    "output_path",
+)
+_KEY_FIELD_SET = frozenset(_KEY_FIELDS)
+
+_SCALAR_TYPES = (int, float, bool, type(None))
+
+
+def _key_value(value: Any) -> Hashable:
+    """Return the canonical, hashable form of a cache key parameter.
+
+    Strings are interned so that keys built from the same parameters share
+    their string objects and compare by identity on lookup.
+
+    Args:
+        value: Scalar, layer, or other parameter value.
+
+    Returns:
+        Scalars unchanged, strings interned, layers as their interned
+        `layer_identity`, other objects as their ``repr``.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, QgsMapLayer):
+        return sys.intern(layer_identity(value))
+    return repr(value)
+
+
+class _EmptyResult:
+    """Marker cached for a computation that produced no data.
+
+    Lets callers tell a cached negative result apart from a cache miss
+    (``None``). The marker keeps its identity across pickling so it also
+    survives the persistent disk tier.
+    """
+
+    _instance: Optional[_EmptyResult] = None
+
+    def __new__(cls) -> _EmptyResult:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __reduce__(self) -> tuple:
+        return (_EmptyResult, ())
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "EMPTY_RESULT"
+
+
+EMPTY_RESULT = _EmptyResult()
+
 
 class DataCache(ICacheService):
     """Memory-based cache service for storing processed profile data.
 
-    Implements ICacheService. Supports categorized buckets ('topo', 'geol', 'struct', 'drill'),
-    Time-To-Live (TTL) expiration, and arbitrary metadata (e.g., for LOD tracking).
+    Implements ICacheService. Supports categorized buckets ('topo', 'geol',
+    'geol_isect', 'struct', 'drill'), Time-To-Live (TTL) expiration, and
+    arbitrary metadata (e.g., for LOD tracking).
+    Each bucket holds at most ``max_entries`` items; when full, the least
+    recently used entry is evicted. Buckets that rarely serve hits are
+    shrunk by `rebalance` and grown back once they would serve hits again.
+    All operations are thread-safe.
     """
 
-    def __init__(self, default_ttl: int = 3600) -> None:
+    def __init__(self, default_ttl: int = 3600, max_entries: int = 32) -> None:
         """Initialize the data cache.
 
         Args:
             default_ttl: Default Time-To-Live in seconds for new entries.
+            max_entries: Maximum number of entries per bucket (0 disables the limit).
         """
-        # Buckets: 'topo', 'geol', 'struct', 'drill'
-        self._buckets: dict[str, dict[str, dict[str, Any]]] = {
-            "topo": {},
-            "geol": {},
-            "struct": {},
-            "drill": {},
+        # Buckets: 'topo', 'geol', 'geol_isect', 'struct', 'drill'
+        # Each bucket is kept in recency order, least recently used first
+        self._buckets: dict[str, OrderedDict[Hashable, dict[str, Any]]] = {
+            "topo": OrderedDict(),
+            "geol": OrderedDict(),
+            "geol_isect": OrderedDict(),
+            "struct": OrderedDict(),
+            "drill": OrderedDict(),
         }
         self.default_ttl = default_ttl
-        logger.debug(f"CacheService initialized (Default TTL: {default_ttl}s)")
-
-    def get_cache_key(self, params: dict[str, Any]) -> str:
-        """Generate a unique MD5 hash key from input parameters.
+        self.max_entries = max_entries
+        # Per-bucket limits lowered by `rebalance`; others use max_entries
+        self._bucket_limits: dict[str, int] = {}
+        # Lookup outcomes per bucket since the last `rebalance`
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+        # Keys evicted by a lowered limit, most recent last; a miss on one of
+        # them is a hit the full limit would have served
+        self._evicted: dict[str, OrderedDict[Hashable, None]] = {}
+        self._evicted_misses: Counter[str] = Counter()
+        # Min-heap of (expiry, seq, bucket, key); seq breaks ties between
+        # keys that do not compare. Entries re-set since are skipped.
+        self._expiry_heap: list[tuple[float, int, str, Hashable]] = []
+        self._expiry_seq = itertools.count()
+        self._lock = threading.RLock()
+        # Events for (bucket, key) pairs being computed by `get_or_compute`
+        self._inflight: dict[tuple[str, Hashable], threading.Event] = {}
+        # Identical profiles cached under several keys share one array
+        self._interned: weakref.WeakValueDictionary[bytes, ProfileArray] = (
+            weakref.WeakValueDictionary()
+        )
+        logger.debug(
+            f"CacheService initialized (Default TTL: {default_ttl}s, "
+            f"Max entries/bucket: {max_entries})"
+        )
+
+    def get_cache_key(self, params: dict[str, Any]) -> tuple:
+        """Generate a canonical tuple key from input parameters.
+
+        Dicts hash tuples natively, so no digest is computed on lookup.
+        Known dialog parameters are read in a fixed order; any others are
+        appended as sorted (name, value) pairs.
 
         Args:
-            params: Dictionary of parameters to hash.
+            params: Dictionary of parameters to build the key from.
 
         Returns:
-            The generated MD5 hash string.
+            A tuple of canonical parameter values.
         """
-        key_parts = []
-        for k, v in sorted(params.items()):
-            # Filter objects by ID or string representation
-            if hasattr(v, "id"):
-                key_parts.append(f"{k}:{v.id()}")
-            elif hasattr(v, "source"):
-                key_parts.append(f"{k}:{v.source()}")
-            else:
-                key_parts.append(f"{k}:{v!s}")
-
-        return hashlib.md5("".join(key_parts).encode("utf-8")).hexdigest()
-
-    def get(self, bucket: str, key: str) -> Optional[Any]:
+        key = tuple(_key_value(params.get(name)) for name in _KEY_FIELDS)
+        extra = params.keys() - _KEY_FIELD_SET
+        if extra:
+            key += tuple(
+                (sys.intern(name), _key_value(params[name])) for name in sorted(extra)
+            )
+        return key
+
+    def get(
+        self, bucket: str, key: str, fingerprint: Optional[Hashable] = None
+    ) -> Optional[Any]:
         """Retrieve data from a specific cache bucket if not expired.
 
         Args:
             bucket: Name of the cache category (e.g., 'topo').
             key: Unique hash key for the entry.
+            fingerprint: Optional full parameter fingerprint. If given, an
+                entry stored under a different fingerprint is a key
+                collision; it is dropped and treated as a miss.
 
         Returns:
             The cached data if valid and found, else None.
         """
-        if bucket not in self._buckets:
-            return None
-
-        entry = self._buckets[bucket].get(key)
-        if not entry:
-            return None
-
-        # Check TTL
-        expiry = entry.get("expiry")
-        if expiry and time.time() > expiry:
-            logger.debug(f"Cache miss (TTL expired): {bucket}/{key}")
-            del self._buckets[bucket][key]
+        entries = self._buckets.get(bucket)
+        if entries is None:
             return None
 
-        return entry.get("data")
+        # Stored entries are never mutated (`set` replaces them), so a hit is
+        # validated without the lock; only the recency and hit count updates,
+        # which race with eviction in other threads, take it.
+        entry = entries.get(key)
+        if entry is not None:
+            expiry = entry["expiry"]
+            if (not expiry or time.time() <= expiry) and (
+                fingerprint is None or entry["params_fingerprint"] == fingerprint
+            ):
+                with self._lock:
+                    if key in entries:
+                        entries.move_to_end(key)
+                    self._hits[bucket] += 1
+                return entry["data"]
+
+        with self._lock:
+            entry = entries.get(key)
+            if not entry:
+                self._misses[bucket] += 1
+                if key in self._evicted.get(bucket, ()):
+                    self._evicted_misses[bucket] += 1
+                return None
+
+            # Check TTL
+            expiry = entry["expiry"]
+            if expiry and time.time() > expiry:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache miss (TTL expired): {bucket}/{_key_label(key)}")
+                del entries[key]
+                self._misses[bucket] += 1
+                return None
+
+            if fingerprint is not None and entry["params_fingerprint"] != fingerprint:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache miss (key collision): {bucket}/{_key_label(key)}")
+                del entries[key]
+                self._misses[bucket] += 1
+                return None
+
+            # Stored by another thread since the unlocked lookup
+            entries.move_to_end(key)
+            self._hits[bucket] += 1
+            return entry["data"]
 
     def set(
-        self, bucket: str, key: str, data: Any, metadata: Optional[dict] = None
+        self,
+        bucket: str,
+        key: str,
+        data: Any,
+        metadata: Optional[dict] = None,
+        fingerprint: Optional[Hashable] = None,
     ) -> None:
         """Store data in a specific cache bucket with optional metadata.
 
@@ -89,19 +312,169 @@ class DataCache(ICacheService):
             key: Unique hash key for the entry.
             data: The data object to be cached.
             metadata: Optional dictionary for TTL or Level of Detail information.
+            fingerprint: Optional full parameter fingerprint checked by `get`.
         """
-        if bucket not in self._buckets:
-            self._buckets[bucket] = {}
+        with self._lock:
+            now = time.time()
+            self._sweep_expired(now)
 
-        ttl = (metadata or {}).get("ttl", self.default_ttl)
-        expiry = time.time() + ttl if ttl > 0 else None
+            if bucket not in self._buckets:
+                self._buckets[bucket] = OrderedDict()
 
-        self._buckets[bucket][key] = {
-            "data": data,
-            "expiry": expiry,
-            "metadata": metadata or {},
-            "timestamp": time.time(),
-        }
+            entries = self._buckets[bucket]
+
+            if isinstance(data, ProfileArray):
+                data = self._intern(data)
+
+            ttl = (metadata or {}).get("ttl", self.default_ttl)
+            expiry = now + ttl if ttl > 0 else None
+            if expiry is not None:
+                heapq.heappush(
+                    self._expiry_heap, (expiry, next(self._expiry_seq), bucket, key)
+                )
+
+            evicted = self._evicted.get(bucket)
+            if evicted:
+                evicted.pop(key, None)
+
+            entries[key] = {
+                "data": data,
+                "expiry": expiry,
+                "metadata": metadata or {},
+                "timestamp": now,
+                "params_fingerprint": fingerprint,
+            }
+            entries.move_to_end(key)
+
+            self._evict(bucket, self._bucket_limits.get(bucket, self.max_entries))
+
+    def _evict(self, bucket: str, limit: int) -> None:
+        """Drop least recently used entries until a bucket fits its limit.
+
+        Args:
+            bucket: Name of the cache category.
+            limit: Maximum number of entries to keep (0 disables the limit).
+        """
+        entries = self._buckets[bucket]
+        if limit > 0:
+            lowered = limit < self.max_entries
+            while len(entries) > limit:
+                victim, _ = entries.popitem(last=False)
+                if lowered:
+                    evicted = self._evicted.setdefault(bucket, OrderedDict())
+                    evicted[victim] = None
+                    if len(evicted) > self.max_entries:
+                        evicted.popitem(last=False)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache eviction (LRU): {bucket}/{_key_label(victim)}")
+
+    def get_or_compute(
+        self,
+        bucket: str,
+        key: str,
+        factory: Callable[[], Any],
+        metadata: Optional[dict] = None,
+        fingerprint: Optional[Hashable] = None,
+    ) -> Any:
+        """Return a cached entry, computing and storing it once on a miss.
+
+        Concurrent callers missing on the same key do not repeat the work:
+        the first one runs ``factory`` while the others wait for its result.
+        If it fails or returns None, the next waiter computes instead.
+
+        Args:
+            bucket: Name of the cache category.
+            key: Unique hash key for the entry.
+            factory: Callable producing the data on a miss.
+            metadata: Optional dictionary for TTL or Level of Detail information.
+            fingerprint: Optional full parameter fingerprint; see `get`.
+
+        Returns:
+            The cached or freshly computed data.
+        """
+        inflight_key = (bucket, key)
+        while True:
+            # Callers arriving while the entry is computed wait for it without
+            # a lookup, so they are not counted as misses
+            event = self._inflight.get(inflight_key)
+            if event is None:
+                # Looked up outside the lock: the persistent tier may read disk
+                data = self.get(bucket, key, fingerprint)
+                if data is not None:
+                    return data
+                with self._lock:
+                    # Stored or claimed by another caller since the lookup
+                    data = self._peek(bucket, key, fingerprint)
+                    if data is not None:
+                        return data
+                    event = self._inflight.get(inflight_key)
+                    if event is None:
+                        event = self._inflight[inflight_key] = threading.Event()
+                        break
+            event.wait()
+
+        try:
+            data = factory()
+            if data is not None:
+                self.set(bucket, key, data, metadata, fingerprint)
+            return data
+        finally:
+            with self._lock:
+                del self._inflight[inflight_key]
+            event.set()
+
+    def _peek(
+        self, bucket: str, key: str, fingerprint: Optional[Hashable] = None
+    ) -> Optional[Any]:
+        """Return a valid in-memory entry without counting the lookup.
+
+        Args:
+            bucket: Name of the cache category.
+            key: Unique hash key for the entry.
+            fingerprint: Optional full parameter fingerprint; see `get`.
+
+        Returns:
+            The cached data if present, unexpired and matching, else None.
+        """
+        entry = self._buckets.get(bucket, {}).get(key)
+        if entry is None:
+            return None
+        expiry = entry["expiry"]
+        if expiry and time.time() > expiry:
+            return None
+        if fingerprint is not None and entry["params_fingerprint"] != fingerprint:
+            return None
+        return entry["data"]
+
+    def _intern(self, profile: ProfileArray) -> ProfileArray:
+        """Return the already cached profile with the same samples, if any.
+
+        Args:
+            profile: Profile about to be stored.
+
+        Returns:
+            A previously stored identical profile, or ``profile`` itself.
+        """
+        digest = hashlib.blake2b(profile.array.tobytes(), digest_size=16).digest()
+        return self._interned.setdefault(digest, profile)
+
+    def _sweep_expired(self, now: float) -> None:
+        """Drop entries whose TTL has passed, oldest expiry first.
+
+        Only the top of the heap is inspected, so untouched entries are
+        released without scanning the buckets. Heap items whose entry was
+        re-set, evicted or invalidated since are discarded.
+
+        Args:
+            now: Current time in seconds since the epoch.
+        """
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expiry, _, bucket, key = heapq.heappop(heap)
+            entries = self._buckets.get(bucket)
+            entry = entries.get(key) if entries is not None else None
+            if entry is not None and entry["expiry"] == expiry:
+                del entries[key]
 
     def invalidate(self, bucket: Optional[str] = None, key: Optional[str] = None) -> None:
         """Remove entries from the cache selectively or entirely.
@@ -110,15 +483,53 @@ class DataCache(ICacheService):
             bucket: Optional name of the bucket to invalidate.
             key: Optional specific entry key to remove within the bucket.
         """
-        if bucket and bucket in self._buckets:
-            if key:
-                if key in self._buckets[bucket]:
-                    del self._buckets[bucket][key]
-            else:
-                self._buckets[bucket].clear()
-        elif not bucket:
-            for b in self._buckets.values():
-                b.clear()
+        with self._lock:
+            if bucket and bucket in self._buckets:
+                if key:
+                    if key in self._buckets[bucket]:
+                        del self._buckets[bucket][key]
+                else:
+                    self._buckets[bucket].clear()
+            elif not bucket:
+                for b in self._buckets.values():
+                    b.clear()
+                self._expiry_heap.clear()
+
+    def invalidate_where(self, predicate: Callable[[dict[str, Any]], bool]) -> int:
+        """Remove the entries whose metadata satisfies a predicate.
+
+        Matching keys are collected first and deleted in place, so buckets
+        are not rebuilt and surviving entries are left untouched.
+
+        Args:
+            predicate: Called with each entry's metadata dictionary.
+
+        Returns:
+            Number of in-memory entries removed.
+        """
+        with self._lock:
+            removed = 0
+            for entries in self._buckets.values():
+                stale = [key for key, entry in entries.items() if predicate(entry["metadata"])]
+                for key in stale:
+                    del entries[key]
+                removed += len(stale)
+            return removed
+
+    def invalidate_layer(self, layer_id: str) -> None:
+        """Remove only the entries that depend on a given layer.
+
+        Entries are matched through the ``layer_ids`` list stored in their
+        metadata.
+
+        Args:
+            layer_id: ID of the QGIS layer whose data changed or was removed.
+        """
+        removed = self.invalidate_where(
+            lambda metadata: layer_id in metadata.get("layer_ids", ())
+        )
+        if removed:
+            logger.debug(f"Invalidated {removed} cache entries for layer {layer_id}")
 
     def clear(self) -> None:
         """Clear all entries across all cache buckets."""
@@ -134,40 +545,415 @@ class DataCache(ICacheService):
         Returns:
             Metadata dictionary if found, else None.
         """
-        if bucket in self._buckets and key in self._buckets[bucket]:
-            return self._buckets[bucket][key].get("metadata")
-        return None
+        entry = self._buckets.get(bucket, {}).get(key)
+        return entry["metadata"] if entry else None
+
+    def get_cache_size(self) -> dict[str, int]:
+        """Get the number of entries in each bucket.
+
+        Returns:
+            Dictionary mapping bucket names to entry counts.
+        """
+        return {name: len(items) for name, items in self._buckets.items()}
 
-    # --- Backward compatibility methods (will be removed in v3.0) ---
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get in-memory lookup statistics for each bucket.
 
-    def get_topographic_profile(self, key: str) -> Optional[Any]:
-        """Obsolete: use get('topo', key)."""
-        return self.get("topo", key)
+        Counts cover the lookups since the last `rebalance`. For the
+        persistent cache, an entry promoted from disk counts as a miss.
 
-    def set_topographic_profile(self, key: str, data: Any) -> None:
-        """Obsolete: use set('topo', key, data)."""
-        self.set("topo", key, data)
+        Returns:
+            Dictionary mapping bucket names to their ``hits``, ``misses``,
+            ``hit_rate`` (None without lookups), ``entries`` and ``limit``.
+        """
+        with self._lock:
+            result = {}
+            for name, items in self._buckets.items():
+                hits = self._hits[name]
+                lookups = hits + self._misses[name]
+                result[name] = {
+                    "hits": hits,
+                    "misses": self._misses[name],
+                    "hit_rate": hits / lookups if lookups else None,
+                    "entries": len(items),
+                    "limit": self._bucket_limits.get(name, self.max_entries),
+                }
+            return result
+
+    def rebalance(self, min_hit_rate: float = 0.1, min_lookups: int = 20) -> dict[str, int]:
+        """Resize bucket limits according to their recent hit rate.
+
+        Buckets with at least ``min_lookups`` lookups and a hit rate below
+        ``min_hit_rate`` keep half as many entries (at least one); their
+        least recently used entries are evicted right away. A shrunk bucket
+        doubles its limit again, up to ``max_entries``, once its hit rate
+        reaches ``min_hit_rate`` counting misses on keys its lowered limit
+        evicted. The counters of evaluated buckets are reset, so each call
+        judges recent usage only.
 
-    def get_geological_profile(self, key: str) -> Optional[Any]:
-        """Obsolete: use get('geol', key)."""
-        return self.get("geol", key)
+        Args:
+            min_hit_rate: Hit rate below which a bucket is shrunk.
+            min_lookups: Minimum number of lookups before a bucket is judged.
 
-    def set_geological_profile(self, key: str, data: Any) -> None:
-        """Obsolete: use set('geol', key, data)."""
-        self.set("geol", key, data)
+        Returns:
+            Dictionary mapping each resized bucket to its new limit.
+        """
+        if self.max_entries <= 0:
+            return {}
+
+        with self._lock:
+            resized = {}
+            for name in self._buckets:
+                hits = self._hits[name]
+                lookups = hits + self._misses[name]
+                if lookups < min_lookups:
+                    continue
+                reachable = hits + self._evicted_misses[name]
+                self._hits[name] = self._misses[name] = self._evicted_misses[name] = 0
+                limit = self._bucket_limits.get(name, self.max_entries)
+
+                if reachable / lookups >= min_hit_rate:
+                    if limit >= self.max_entries:
+                        continue
+                    limit = min(limit * 2, self.max_entries)
+                    if limit == self.max_entries:
+                        del self._bucket_limits[name]
+                        self._evicted.pop(name, None)
+                    else:
+                        self._bucket_limits[name] = limit
+                elif limit > 1:
+                    limit = self._bucket_limits[name] = limit // 2
+                    self._evict(name, limit)
+                else:
+                    continue
+                resized[name] = limit
+
+        if resized:
+            logger.debug(f"Cache bucket limits rebalanced: {resized}")
+        return resized
+
+
+class PersistentDataCache(DataCache):
+    """Two-tier cache: in-memory buckets backed by compressed pickles on disk.
+
+    Lookups check memory first and then disk; disk hits are promoted back to
+    memory. Entries whose payload cannot be pickled (e.g. objects holding
+    native QGIS geometries) or whose metadata sets ``persist`` to False are
+    kept in memory only. Disk entries honor the
+    same TTL as memory entries, which bounds staleness across sessions.
+    The disk tier is capped at ``size_limit`` bytes; least recently used
+    files are pruned first.
+
+    Large `ProfileArray` payloads are written as ``.npy`` files next to their
+    entry and cached as read-only memory maps, so the OS page cache rather
+    than the process heap holds the samples.
+
+    Each entry's metadata is also written to a small uncompressed sidecar
+    file, from which an in-memory index is loaded once. Invalidation
+    matches entries against that index and never reads their payloads.
+    """
 
-    def get_structural_data(self, key: str) -> Optional[Any]:
-        """Obsolete: use get('struct', key)."""
-        return self.get("struct", key)
+    def __init__(
+        self,
+        cache_dir: Path,
+        default_ttl: int = 3600,
+        max_entries: int = 32,
+        size_limit: int = 2 << 30,
+    ) -> None:
+        """Initialize the persistent data cache.
 
-    def set_structural_data(self, key: str, data: Any) -> None:
-        """Obsolete: use set('struct', key, data)."""
-        self.set("struct", key, data)
+        Args:
+            cache_dir: Directory where compressed entries are stored.
+            default_ttl: Default Time-To-Live in seconds for new entries.
+            max_entries: Maximum number of in-memory entries per bucket.
+            size_limit: Maximum total size of the disk tier in bytes
+                (0 disables the limit).
+        """
+        super().__init__(default_ttl, max_entries)
+        self.cache_dir = Path(cache_dir)
+        self.size_limit = size_limit
+        # Bytes used on disk, measured on the first write
+        self._disk_usage: Optional[int] = None
+        # Metadata of each disk entry, loaded from the sidecars on first use
+        self._disk_metadata: Optional[dict[Path, dict[str, Any]]] = None
+        logger.debug(f"Persistent cache directory: {self.cache_dir}")
+
+    def _entry_path(self, bucket: str, key: Hashable) -> Path:
+        return self.cache_dir / bucket / f"{_key_label(key)}{_DISK_SUFFIX}"
+
+    def get(
+        self, bucket: str, key: str, fingerprint: Optional[Hashable] = None
+    ) -> Optional[Any]:
+        """Retrieve data from memory, falling back to the disk tier.
 
-    def get_cache_size(self) -> dict[str, int]:
-        """Get the number of entries in each bucket.
+        Args:
+            bucket: Name of the cache category (e.g., 'topo').
+            key: Unique hash key for the entry.
+            fingerprint: Optional full parameter fingerprint; see `DataCache.get`.
 
         Returns:
-            Dictionary mapping bucket names to entry counts.
+            The cached data if valid and found, else None.
         """
-        return {name: len(items) for name, items in self._buckets.items()}
+        data = super().get(bucket, key, fingerprint)
+        if data is not None:
+            return data
+
+        path = self._entry_path(bucket, key)
+        if not path.exists():
+            return None
+
+        try:
+            entry = pickle.loads(_decompress(path.read_bytes()))
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cache file {path}: {e}")
+            self._unlink_entry(path)
+            return None
+
+        expiry = entry.get("expiry")
+        if expiry and time.time() > expiry:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache miss (TTL expired on disk): {bucket}/{_key_label(key)}")
+            self._unlink_entry(path)
+            return None
+
+        stored_fingerprint = entry.get("params_fingerprint")
+        if fingerprint is not None and stored_fingerprint != fingerprint:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache miss (key collision on disk): {bucket}/{_key_label(key)}")
+            self._unlink_entry(path)
+            return None
+
+        data = entry["data"]
+        if entry.get("mmap"):
+            try:
+                data = ProfileArray(np.load(path.with_suffix(".npy"), mmap_mode="r"))
+            except (OSError, ValueError) as e:
+                logger.debug(f"Discarding cache entry with unreadable array {path}: {e}")
+                self._unlink_entry(path)
+                return None
+
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        metadata = dict(entry.get("metadata") or {})
+        metadata["ttl"] = expiry - time.time() if expiry else 0
+        super().set(bucket, key, data, metadata, stored_fingerprint)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Cache hit (disk): {bucket}/{_key_label(key)}")
+        return data
+
+    def set(
+        self,
+        bucket: str,
+        key: str,
+        data: Any,
+        metadata: Optional[dict] = None,
+        fingerprint: Optional[Hashable] = None,
+    ) -> None:
+        """Store data in memory and, when picklable and persistable, on disk.
+
+        Args:
+            bucket: Name of the cache category.
+            key: Unique hash key for the entry.
+            data: The data object to be cached.
+            metadata: Optional dictionary for TTL or Level of Detail
+                information. A false ``persist`` flag keeps the entry in
+                memory only.
+            fingerprint: Optional full parameter fingerprint checked by `get`.
+        """
+        path = self._entry_path(bucket, key)
+        if not (metadata or {}).get("persist", True):
+            super().set(bucket, key, data, metadata, fingerprint)
+            # Drop any copy persisted before the inputs stopped qualifying
+            if path.exists():
+                self._unlink_entry(path)
+            return
+
+        replaced = self._entry_size(path)
+
+        mapped = None
+        if isinstance(data, ProfileArray) and data.array.nbytes >= _MMAP_MIN_BYTES:
+            mapped = self._store_mapped_array(path, data)
+            if mapped is not None:
+                data = mapped
+
+        super().set(bucket, key, data, metadata, fingerprint)
+        entry = self._buckets[bucket][key]
+
+        try:
+            payload = pickle.dumps(
+                {
+                    "data": None if mapped is not None else data,
+                    "mmap": mapped is not None,
+                    "expiry": entry["expiry"],
+                    "metadata": entry["metadata"],
+                    "params_fingerprint": fingerprint,
+                },
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache entry {bucket}/{_key_label(key)} kept in memory only: {e}")
+            return
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            meta_path = path.with_suffix(_META_SUFFIX)
+            tmp_path = meta_path.with_name(meta_path.name + ".tmp")
+            tmp_path.write_bytes(pickle.dumps(entry["metadata"], protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_path, meta_path)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(_compress(payload))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache file {path}: {e}")
+            return
+
+        with self._lock:
+            if self._disk_metadata is not None:
+                self._disk_metadata[path] = entry["metadata"]
+
+        if self.size_limit > 0:
+            with self._lock:
+                if self._disk_usage is None:
+                    self._disk_usage = sum(self._entry_size(f) for f in self._disk_files())
+                else:
+                    self._disk_usage += self._entry_size(path) - replaced
+                if self._disk_usage > self.size_limit:
+                    self._prune_disk()
+
+    def _store_mapped_array(self, path: Path, profile: ProfileArray) -> Optional[ProfileArray]:
+        """Write a profile next to its entry file and map it back read-only.
+
+        Args:
+            path: Entry file the array belongs to.
+            profile: Profile to store.
+
+        Returns:
+            A profile backed by the memory-mapped file, or None if it could
+            not be written (e.g. the old file is still mapped on Windows).
+        """
+        npy_path = path.with_suffix(".npy")
+        tmp_path = npy_path.with_name(npy_path.name + ".tmp")
+        try:
+            npy_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.save(f, profile.array)
+            os.replace(tmp_path, npy_path)
+            return ProfileArray(np.load(npy_path, mmap_mode="r"))
+        except (OSError, ValueError) as e:
+            logger.debug(f"Keeping profile {path.stem} in memory: {e}")
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+            return None
+
+    def _disk_files(self) -> list[Path]:
+        """Return all entry files of the disk tier."""
+        return list(self.cache_dir.glob(f"*/*{_DISK_SUFFIX}"))
+
+    @staticmethod
+    def _entry_size(path: Path) -> int:
+        """Return the bytes used by an entry file, its array file and sidecar."""
+        size = 0
+        for file in (path, path.with_suffix(".npy"), path.with_suffix(_META_SUFFIX)):
+            with contextlib.suppress(OSError):
+                size += file.stat().st_size
+        return size
+
+    def _unlink_entry(self, path: Path) -> None:
+        """Delete an entry file, its array file and sidecar, if any.
+
+        The files are measured and removed under the lock, so concurrent
+        deletions of the same entry subtract its size from the disk usage
+        only once.
+        """
+        with self._lock:
+            if self._disk_metadata is not None:
+                self._disk_metadata.pop(path, None)
+            if self._disk_usage is not None:
+                self._disk_usage = max(0, self._disk_usage - self._entry_size(path))
+            for file in (path, path.with_suffix(".npy"), path.with_suffix(_META_SUFFIX)):
+                try:
+                    file.unlink(missing_ok=True)
+                except OSError as e:
+                    logger.warning(f"Could not remove cache file {file}: {e}")
+
+    def _disk_index(self) -> dict[Path, dict[str, Any]]:
+        """Return the metadata of every disk entry, loading the sidecars once.
+
+        Entries without a readable sidecar cannot be matched on invalidation,
+        so they are deleted. Must be called with the lock held.
+        """
+        if self._disk_metadata is None:
+            index = {}
+            orphans = []
+            for path in self._disk_files():
+                try:
+                    index[path] = pickle.loads(path.with_suffix(_META_SUFFIX).read_bytes())
+                except Exception:
+                    orphans.append(path)
+            for path in orphans:
+                self._unlink_entry(path)
+            self._disk_metadata = index
+            logger.debug(f"Loaded metadata of {len(index)} disk cache entries")
+        return self._disk_metadata
+
+    def _prune_disk(self) -> None:
+        """Delete least recently used disk entries until below 90% of the limit.
+
+        Disk hits refresh the file modification time, so it tracks recency.
+        """
+        target = int(self.size_limit * 0.9)
+        files = []
+        for path in self._disk_files():
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            files.append((mtime, self._entry_size(path), path))
+        files.sort(key=lambda f: f[0])
+
+        usage = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if usage <= target:
+                break
+            self._unlink_entry(path)
+            usage -= size
+        self._disk_usage = usage
+        logger.debug(f"Pruned disk cache to {usage} bytes")
+
+    def invalidate_where(self, predicate: Callable[[dict[str, Any]], bool]) -> int:
+        """Remove the entries whose metadata satisfies a predicate, in memory and on disk.
+
+        Args:
+            predicate: Called with each entry's metadata dictionary.
+
+        Returns:
+            Number of in-memory entries removed.
+        """
+        removed = super().invalidate_where(predicate)
+
+        # Disk entries may not be in memory; match the indexed metadata
+        with self._lock:
+            stale = [path for path, metadata in self._disk_index().items() if predicate(metadata)]
+        for path in stale:
+            self._unlink_entry(path)
+        return removed
+
+    def invalidate(self, bucket: Optional[str] = None, key: Optional[str] = None) -> None:
+        """Remove entries from both memory and disk.
+
+        Args:
+            bucket: Optional name of the bucket to invalidate.
+            key: Optional specific entry key to remove within the bucket.
+        """
+        super().invalidate(bucket, key)
+
+        if bucket and key:
+            paths = [self._entry_path(bucket, key)]
+        elif bucket:
+            paths = list((self.cache_dir / bucket).glob(f"*{_DISK_SUFFIX}"))
+        else:
+            paths = self._disk_files()
+
+        for path in paths:
+            self._unlink_entry(path)
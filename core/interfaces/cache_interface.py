@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable
 from typing import Any, Optional, Protocol, runtime_checkable
 
 
@@ -7,12 +8,16 @@ from typing import Any, Optional, Protocol, runtime_checkable
 class ICacheService(Protocol):
     """Abstract protocol for the Processing Data Cache Service."""
 
-    def get(self, bucket: str, key: str) -> Optional[Any]:
+    def get(
+        self, bucket: str, key: str, fingerprint: Optional[Hashable] = None
+    ) -> Optional[Any]:
         """Retrieve data from a specific cache bucket.
 
         Args:
             bucket: The cache category (e.g., 'topo', 'geol').
             key: Unique key for the parameter set.
+            fingerprint: Optional full parameter fingerprint; entries stored
+                under a different fingerprint are treated as a miss.
 
         Returns:
             The cached data or None if not found or expired.
@@ -20,7 +25,12 @@ class ICacheService(Protocol):
         ...
 
     def set(
-        self, bucket: str, key: str, data: Any, metadata: Optional[dict] = None
+        self,
+        bucket: str,
+        key: str,
+        data: Any,
+        metadata: Optional[dict] = None,
+        fingerprint: Optional[Hashable] = None,
     ) -> None:
         """Store data in a specific cache bucket.
 
@@ -29,6 +39,29 @@ class ICacheService(Protocol):
             key: Unique key for the parameter set.
             data: The data to cache.
             metadata: Optional metadata (e.g., TTL, LOD info).
+            fingerprint: Optional full parameter fingerprint checked by `get`.
+        """
+        ...
+
+    def get_or_compute(
+        self,
+        bucket: str,
+        key: str,
+        factory: Callable[[], Any],
+        metadata: Optional[dict] = None,
+        fingerprint: Optional[Hashable] = None,
+    ) -> Any:
+        """Return a cached entry, computing it only once across threads on a miss.
+
+        Args:
+            bucket: The cache category.
+            key: Unique key for the parameter set.
+            factory: Callable producing the data on a miss.
+            metadata: Optional metadata (e.g., TTL, LOD info).
+            fingerprint: Optional full parameter fingerprint checked on lookup.
+
+        Returns:
+            The cached or freshly computed data.
         """
         ...
 
@@ -41,10 +74,49 @@ class ICacheService(Protocol):
         """
         ...
 
+    def invalidate_where(self, predicate: Callable[[dict[str, Any]], bool]) -> int:
+        """Invalidate entries whose metadata satisfies a predicate.
+
+        Args:
+            predicate: Called with each entry's metadata dictionary.
+
+        Returns:
+            Number of entries removed.
+        """
+        ...
+
+    def invalidate_layer(self, layer_id: str) -> None:
+        """Invalidate entries that depend on a specific layer.
+
+        Args:
+            layer_id: ID of the layer whose data changed or was removed.
+        """
+        ...
+
     def clear(self) -> None:
         """Clear the entire cache."""
         ...
 
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Retrieve per-bucket lookup statistics.
+
+        Returns:
+            Dictionary mapping bucket names to hit/miss counts and hit rate.
+        """
+        ...
+
+    def rebalance(self, min_hit_rate: float = 0.1, min_lookups: int = 20) -> dict[str, int]:
+        """Shrink buckets whose hit rate is too low to justify their size.
+
+        Args:
+            min_hit_rate: Hit rate below which a bucket is shrunk.
+            min_lookups: Minimum number of lookups before a bucket is judged.
+
+        Returns:
+            Dictionary mapping each shrunk bucket to its new limit.
+        """
+        ...
+
     def get_metadata(self, bucket: str, key: str) -> Optional[dict[str, Any]]:
         """Retrieve metadata for a cached entry.
 
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future
 from typing import Any, Optional
 
+import numpy as np
 from qgis.core import (
     QgsCoordinateReferenceSystem,
     QgsDistanceArea,
+    QgsFeature,
     QgsGeometry,
     QgsPointXY,
     QgsRasterLayer,
@@ -14,6 +17,15 @@ from qgis.core import (
 class IDrillholeService(ABC):
     """Abstract interface for the Drillhole Processing Service."""
 
+    @abstractmethod
+    def invalidate_collar_index(self, layer_id: Optional[str] = None) -> None:
+        """Drop cached collar data of a layer, or of all layers.
+
+        Args:
+            layer_id: ID of the changed layer, or None to drop everything.
+        """
+        pass
+
     @abstractmethod
     def project_collars(
         self,
@@ -30,7 +42,7 @@ class IDrillholeService(ABC):
         collar_depth_field: str,
         dem_layer: Optional[QgsRasterLayer],
         line_crs: Optional[QgsCoordinateReferenceSystem] = None,
-    ) -> list[tuple]:
+    ) -> tuple[np.ndarray, dict[Any, QgsPointXY]]:
         """Project collar points onto section line.
 
         Args:
@@ -49,21 +61,45 @@ class IDrillholeService(ABC):
             line_crs: CRS of the section line for spatial filtering.
 
         Returns:
-            A list of tuples (hole_id, dist_along, z, offset, total_depth).
+            A tuple of (projected_collars, collar_coords): a structured array
+            of ``PROJECTED_COLLAR_DTYPE`` rows (hole_id, dist, z, offset,
+            depth), and a mapping of each projected hole_id to its collar point.
+        """
+        pass
+
+    @abstractmethod
+    def preload_tables(
+        self,
+        executor: Executor,
+        survey_layer: Optional[QgsVectorLayer],
+        interval_layer: Optional[QgsVectorLayer],
+        survey_fields: Optional[dict[str, str]] = None,
+        interval_fields: Optional[dict[str, str]] = None,
+    ) -> tuple[Future, Future]:
+        """Start reading the survey and interval tables in the background.
+
+        Must be called on the thread owning the layers.
+
+        Args:
+            executor: Executor the table reads are submitted to.
+            survey_layer: The survey vector layer.
+            interval_layer: The interval/geology vector layer.
+            survey_fields: Optional mapping of survey field roles to field names.
+            interval_fields: Optional mapping of interval field roles to field names.
+
+        Returns:
+            A tuple of futures resolving to the (survey_features,
+            interval_features) lists expected by `process_intervals`.
         """
         pass
 
     @abstractmethod
     def process_intervals(
         self,
-        collar_points: list[tuple],
-        collar_layer: QgsVectorLayer,
-        survey_layer: QgsVectorLayer,
-        interval_layer: QgsVectorLayer,
-        collar_id_field: str,
-        use_geometry: bool,
-        collar_x_field: str,
-        collar_y_field: str,
+        collar_points: np.ndarray,
+        collar_coords: dict[Any, QgsPointXY],
+        survey_features: list[QgsFeature],
+        interval_features: list[QgsFeature],
         line_geom: QgsGeometry,
         line_start: QgsPointXY,
         distance_area: QgsDistanceArea,
@@ -75,14 +111,10 @@ class IDrillholeService(ABC):
         """Process drillhole interval data and project onto the section.
 
         Args:
-            collar_points: List of projected collar tuples from `project_collars`.
-            collar_layer: The collar vector layer.
-            survey_layer: The survey vector layer.
-            interval_layer: The interval/geology vector layer.
-            collar_id_field: Field name for hole ID in collar layer.
-            use_geometry: Use geometry for collar coordinates.
-            collar_x_field: Field name for X in collar layer.
-            collar_y_field: Field name for Y in collar layer.
+            collar_points: Projected collar array from `project_collars`.
+            collar_coords: Collar point of each hole, from `project_collars`.
+            survey_features: Survey features, as returned by `preload_tables`.
+            interval_features: Interval features, as returned by `preload_tables`.
             line_geom: Section line geometry.
             line_start: Section line start point.
             distance_area: Distance calculation object.
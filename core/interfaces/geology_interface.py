@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
-from qgis.core import QgsRasterLayer, QgsVectorLayer
+from qgis.core import QgsGeometry, QgsPointXY, QgsRasterLayer, QgsVectorLayer
 
 
 class IGeologyService(ABC):
@@ -29,3 +29,49 @@ class IGeologyService(ABC):
             GeologyData: List of GeologySegment objects.
         """
         pass
+
+    @abstractmethod
+    def compute_intersections(
+        self,
+        line_lyr: QgsVectorLayer,
+        line_start: QgsPointXY,
+        outcrop_lyr: QgsVectorLayer,
+        outcrop_name_field: str,
+    ) -> list:
+        """Intersect the section line with outcrop polygons, without elevations.
+
+        Args:
+            line_lyr: The cross-section line vector layer.
+            line_start: Start point of the section line.
+            outcrop_lyr: Vector layer containing geological outcrop polygons.
+            outcrop_name_field: The field name for geological unit names.
+
+        Returns:
+            List of OutcropIntersection objects.
+        """
+        pass
+
+    @abstractmethod
+    def sample_elevations(
+        self,
+        line_lyr: QgsVectorLayer,
+        line_geom: QgsGeometry,
+        line_start: QgsPointXY,
+        raster_lyr: QgsRasterLayer,
+        intersections: list,
+        band_number: int = 1,
+    ) -> Any:
+        """Sample DEM elevations along precomputed outcrop intersections.
+
+        Args:
+            line_lyr: The cross-section line vector layer.
+            line_geom: Geometry of the section line.
+            line_start: Start point of the section line.
+            raster_lyr: The DEM raster layer for elevation.
+            intersections: Intersections returned by `compute_intersections`.
+            band_number: Raster band to use for elevation (default: 1).
+
+        Returns:
+            GeologyData: List of GeologySegment objects.
+        """
+        pass
@@ -24,6 +24,6 @@ class IProfileService(ABC):
             interval: Optional sampling interval. If None, uses raster resolution.
 
         Returns:
-            ProfileData: List of (distance, elevation) tuples.
+            ProfileData: ProfileArray of (distance, elevation) samples.
         """
         pass
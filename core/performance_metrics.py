@@ -25,6 +25,8 @@ class MetricsCollector:
         metadata: Dictionary of additional context and metadata.
     """
 
+    __slots__ = ("_start_time", "counts", "metadata", "timings")
+
     def __init__(self):
         """Initialize empty metrics collection."""
         self.timings: dict[str, float] = {}
@@ -83,6 +85,8 @@ class MetricsCollector:
 class PerformanceTimer:
     """Context manager for timing specific operations."""
 
+    __slots__ = ("collector", "duration", "logger_func", "operation_name", "start_time")
+
     def __init__(
         self,
         operation_name: str,
@@ -148,102 +152,153 @@ def format_duration(seconds: float) -> str:
 
 # --- New Implementation ---
 
-from functools import wraps
+import atexit
+from functools import lru_cache, wraps
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import sys
+import threading
 import tracemalloc
 
 
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+
+# Guards the one-time configuration of the "performance" logger
+_logger_setup_lock = threading.Lock()
+
+
 class PerformanceMonitor:
     """Performance monitoring using only Python standard library.
 
-    Tracks duration and memory usage of specific operations.
+    Tracks duration and memory usage of specific operations. Memory is read
+    with O(1) process queries; allocation tracing is only enabled on request
+    since it slows down the measured code.
     """
 
     def __init__(self, log_file="performance.log"):
-        """Initialize monitor and setup logging.
+        """Initialize monitor; logging is set up on first use.
 
         Args:
             log_file: Path to the performance log file.
         """
-        self.logger = self._setup_logger(log_file)
+        self._log_file = log_file
+        self._logger = None
         self.metrics = {}
 
+    @property
+    def logger(self):
+        """Performance logger, configured on first access."""
+        if self._logger is None:
+            self._logger = self._setup_logger(self._log_file)
+        return self._logger
+
     def _setup_logger(self, log_file):
         """Setup performance logger."""
         logger = logging.getLogger("performance")
-        logger.setLevel(logging.INFO)
-
-        # Check if handler already exists to avoid duplicates
-        if not logger.handlers:
-            # Create file handler
-            handler = logging.FileHandler(log_file)
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+
+        # Configure once per process, even if several threads get here
+        with _logger_setup_lock:
+            if not getattr(logger, "_secinterp_configured", False):
+                logger.setLevel(logging.INFO)
+                handler = logging.FileHandler(log_file)
+                formatter = logging.Formatter(
+                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                )
+                handler.setFormatter(formatter)
+
+                # Measured code only enqueues records; a background thread
+                # writes them, and flushes the rest on shutdown
+                log_queue = queue.SimpleQueue()
+                listener = QueueListener(log_queue, handler)
+                listener.start()
+                atexit.register(listener.stop)
+
+                logger.addHandler(QueueHandler(log_queue))
+                logger._secinterp_configured = True
 
         return logger
 
     @contextmanager
-    def measure_operation(self, operation_name, **metadata):
+    def measure_operation(self, operation_name, detailed=False, **metadata):
         """Context manager to measure operation performance (time and memory).
 
         Args:
             operation_name: Human-readable name of the operation.
+            detailed: If True, trace Python allocations with tracemalloc and
+                report their peak during the operation as ``memory_peak_mb``.
+                Otherwise ``process_max_rss_mb`` is reported: the largest
+                resident set size of the process so far, which is not
+                specific to the operation.
             **metadata: Additional context for logging.
+
+        ``memory_mb`` is how much the operation raised the process's largest
+        resident set size; it is 0 when the operation stayed below an earlier
+        peak. Resident set sizes are None where the resource module is
+        unavailable (Windows).
         """
         # Start measuring
         start_time = time.perf_counter()
-        start_memory = self._get_memory_usage()
-        tracemalloc.start()
+        start_rss = self._get_max_rss()
+        # Leave tracing alone if an outer measurement already started it
+        owns_trace = detailed and not tracemalloc.is_tracing()
+        if owns_trace:
+            tracemalloc.start()
 
         try:
             yield
         finally:
             # Stop measuring
             end_time = time.perf_counter()
-            end_memory = self._get_memory_usage()
-
-            try:
-                current, peak = tracemalloc.get_traced_memory()
-            except RuntimeError:
-                # Tracemalloc might not be started if nested calls improperly handle it
-                _current, peak = 0, 0
-
-            tracemalloc.stop()
+            end_rss = self._get_max_rss()
+
+            if detailed:
+                _current, peak = tracemalloc.get_traced_memory()
+                if owns_trace:
+                    tracemalloc.stop()
+                peak_metric = {"memory_peak_mb": round(peak / 1024 / 1024, 2)}
+            else:
+                peak_metric = {
+                    "process_max_rss_mb": round(end_rss, 2) if end_rss is not None else None
+                }
 
             # Calculate metrics
             duration = end_time - start_time
-            memory_diff = end_memory - start_memory
+            memory_diff = end_rss - start_rss if end_rss is not None else None
 
             # Log metrics
             log_data = {
                 "operation": operation_name,
                 "duration_seconds": round(duration, 4),
-                "memory_mb": round(memory_diff, 2),
-                "memory_peak_mb": round(peak / 1024 / 1024, 2),
+                "memory_mb": round(memory_diff, 2) if memory_diff is not None else None,
+                **peak_metric,
                 "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
                 **metadata,
             }
 
-            self.logger.info(f"Performance: {log_data}")
+            self.logger.info("Performance: %s", log_data)
 
             # Store for analysis
             if operation_name not in self.metrics:
                 self.metrics[operation_name] = []
             self.metrics[operation_name].append(log_data)
 
-    def _get_memory_usage(self):
-        """Get current memory usage in MB."""
-        try:
-            import psutil
+    @staticmethod
+    def _get_max_rss():
+        """Get the largest resident set size of the process so far in MB.
 
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024
-        except ImportError:
-            # Fallback without psutil
-            return 0.0
+        Returns None where the resource module is unavailable (Windows).
+        """
+        if resource is None:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in KiB elsewhere
+        return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
 
     def get_operation_stats(self, operation_name):
         """Calculate statistics for multiple runs of an operation.
@@ -252,7 +307,8 @@ class PerformanceMonitor:
             operation_name: Name of the operation to analyze.
 
         Returns:
-            Dictionary with mean/min/max duration and memory usage.
+            Dictionary with mean/min/max duration and memory usage. Memory
+            statistics are None if no run measured memory.
         """
         if operation_name not in self.metrics:
             return None
@@ -260,31 +316,35 @@ class PerformanceMonitor:
         operation_metrics = self.metrics[operation_name]
 
         durations = [m["duration_seconds"] for m in operation_metrics]
-        memory_usages = [m["memory_mb"] for m in operation_metrics]
+        memory_usages = [m["memory_mb"] for m in operation_metrics if m["memory_mb"] is not None]
 
         return {
             "count": len(operation_metrics),
             "avg_duration": sum(durations) / len(durations),
             "min_duration": min(durations),
             "max_duration": max(durations),
-            "avg_memory": sum(memory_usages) / len(memory_usages),
-            "min_memory": min(memory_usages),
-            "max_memory": max(memory_usages),
+            "avg_memory": sum(memory_usages) / len(memory_usages) if memory_usages else None,
+            "min_memory": min(memory_usages, default=None),
+            "max_memory": max(memory_usages, default=None),
         }
 
 
+@lru_cache(maxsize=None)
+def _get_monitor() -> PerformanceMonitor:
+    """Return the monitor shared by all `performance_monitor` decorated functions."""
+    return PerformanceMonitor()
+
+
 def performance_monitor(func):
     """Decorator to automatically monitor function performance.
 
-    Wraps the function call with a PerformanceMonitor measurement.
+    Wraps the function call with a measurement by the shared PerformanceMonitor.
     """
-    monitor = PerformanceMonitor()
+    operation_name = f"{func.__module__}.{func.__name__}"
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        operation_name = f"{func.__module__}.{func.__name__}"
-
-        with monitor.measure_operation(
+        with _get_monitor().measure_operation(
             operation_name, args_count=len(args), kwargs_keys=list(kwargs.keys())
         ):
             return func(*args, **kwargs)
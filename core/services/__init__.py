@@ -4,12 +4,28 @@ This package contains service classes that handle specific data processing tasks
 - ProfileService: Topographic profile generation
 - GeologyService: Geological profile generation
 - StructureService: Structural data projection
+- DrillholeService: Drillhole desurveying and projection
+
+Service classes are imported lazily on first access so that loading the
+package does not pull in every service module.
 """
 
-from .drillhole_service import DrillholeService
-from .geology_service import GeologyService
-from .profile_service import ProfileService
-from .structure_service import StructureService
+from importlib import import_module
+
+
+_SERVICE_MODULES = {
+    "DrillholeService": ".drillhole_service",
+    "GeologyService": ".geology_service",
+    "ProfileService": ".profile_service",
+    "StructureService": ".structure_service",
+}
+
+
+def __getattr__(name):
+    """Import service classes on first access (PEP 562)."""
+    if name in _SERVICE_MODULES:
+        return getattr(import_module(_SERVICE_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -7,34 +7,66 @@ This module provides services for processing and projecting drillhole data,
 including collar projection, trajectory calculation, and interval interpolation.
 """
 
+from concurrent.futures import Executor, Future
 import contextlib
+from functools import partial
+import threading
 from typing import Any, Optional
 
+import numpy as np
 from qgis.core import (
     QgsCoordinateReferenceSystem,
     QgsDistanceArea,
     QgsFeature,
+    QgsFeatureRequest,
+    QgsFields,
     QgsGeometry,
     QgsPointXY,
-    QgsRaster,
     QgsRasterLayer,
     QgsSpatialIndex,
     QgsVectorLayer,
+    QgsVectorLayerFeatureSource,
 )
 
 from sec_interp.core import utils as scu
 from sec_interp.core.exceptions import DataMissingError, GeometryError, ProcessingError
 from sec_interp.core.interfaces.drillhole_interface import IDrillholeService
-from sec_interp.core.types import GeologySegment
+from sec_interp.core.types import PROJECTED_COLLAR_DTYPE, GeologySegment, layer_identity
 from sec_interp.logger_config import get_logger
 
 
 logger = get_logger(__name__)
 
+# Number of collar layers whose spatial index is kept between section lines
+_COLLAR_INDEX_MAX_LAYERS = 2
+
 
 class DrillholeService(IDrillholeService):
     """Service for processing drillhole data."""
 
+    def __init__(self) -> None:
+        """Initialize the service with an empty collar index cache."""
+        # Collar spatial index per layer ID, reused across section lines
+        self._collar_index_cache: dict[
+            str, tuple[str, int, tuple[str, ...], QgsSpatialIndex, dict[int, QgsFeature]]
+        ] = {}
+        self._collar_index_lock = threading.Lock()
+
+    def invalidate_collar_index(self, layer_id: Optional[str] = None) -> None:
+        """Drop the cached collar spatial index of a layer, or of all layers.
+
+        Called when a layer's data changes or the layer is removed, since
+        edits that keep the feature count do not change the index version.
+
+        Args:
+            layer_id: ID of the changed layer, or None to drop every index.
+        """
+        with self._collar_index_lock:
+            if layer_id is None:
+                self._collar_index_cache.clear()
+            else:
+                self._collar_index_cache.pop(layer_id, None)
+
     def project_collars(
         self,
         collar_layer: QgsVectorLayer,
@@ -50,7 +82,7 @@ class DrillholeService(IDrillholeService):
         collar_depth_field: str,
         dem_layer: Optional[QgsRasterLayer],
         line_crs: Optional[QgsCoordinateReferenceSystem] = None,
-    ) -> list[tuple[Any, float, float, float, float]]:
+    ) -> tuple[np.ndarray, dict[Any, QgsPointXY]]:
         """Project collar points onto section line using spatial optimization.
 
         Args:
@@ -69,12 +101,15 @@ class DrillholeService(IDrillholeService):
             line_crs: CRS of the section line for spatial filtering.
 
         Returns:
-            A list of tuples (hole_id, dist_along, z, offset, total_depth).
+            A tuple of (projected_collars, collar_coords): a structured array
+            of ``PROJECTED_COLLAR_DTYPE`` rows (hole_id, dist, z, offset,
+            depth), and a mapping of each projected hole_id to its collar
+            point for `process_intervals`.
         """
         if not collar_layer:
             raise DataMissingError("Collar layer is not provided")
 
-        projected_collars = []
+        no_collars = np.empty(0, dtype=PROJECTED_COLLAR_DTYPE)
         logger.info(f"Projecting collars from {collar_layer.name()} with buffer {buffer_width}m")
 
         # 1. Spatial Filtering
@@ -84,78 +119,169 @@ class DrillholeService(IDrillholeService):
         except Exception as e:
             raise GeometryError("Failed to create section line buffer", {"buffer_width": buffer_width}) from e
 
-        # Use centralized filtering utility which handles CRS transformation
+        # Use centralized filtering utility which handles CRS transformation,
+        # fetching only the collar fields that are read below
+        field_names = [collar_id_field, collar_z_field, collar_depth_field]
+        if not use_geometry:
+            field_names += [collar_x_field, collar_y_field]
+        field_names = [name for name in field_names if name]
         candidate_features = scu.filter_features_by_buffer(
-            collar_layer, line_buffer, line_crs
+            collar_layer,
+            line_buffer,
+            line_crs,
+            field_names,
+            self._collar_index(collar_layer, field_names),
         )
 
         if not candidate_features:
             logger.info("No collars found within buffer area.")
-            return []
+            return no_collars, {}
 
-        for collar_feat in candidate_features:
-            # 1. Get Collar Info
-            collar_info = self._get_collar_info(
-                collar_feat,
+        layer_fields = collar_layer.fields()
+        id_index, x_index, y_index, z_index, depth_index = (
+            self._field_index(layer_fields, name)
+            for name in (
                 collar_id_field,
-                use_geometry,
                 collar_x_field,
                 collar_y_field,
                 collar_z_field,
                 collar_depth_field,
-                dem_layer,
             )
-            if not collar_info:
-                continue
-
-            hole_id, collar_point, z, depth = collar_info
-
-            # 2. Project to section line
-            collar_geom_pt = QgsGeometry.fromPointXY(collar_point)
-            nearest_point = line_geom.nearestPoint(collar_geom_pt).asPoint()
-
-            # Calculate distances
-            dist_along = distance_area.measureLine(line_start, nearest_point)
-            offset = distance_area.measureLine(collar_point, nearest_point)
+        )
 
-            # Check if within buffer
-            if offset <= buffer_width:
-                projected_collars.append((hole_id, dist_along, z, offset, depth))
+        collars = []
+        for collar_feat in candidate_features:
+            # 1. Get Collar Info
+            collar_info = self._get_collar_info(
+                collar_feat,
+                id_index,
+                use_geometry,
+                x_index,
+                y_index,
+                z_index,
+                depth_index,
+            )
+            if collar_info:
+                collars.append(collar_info)
+
+        if not collars:
+            return no_collars, {}
+
+        # 2. Project to section line
+        xy = np.array([(pt.x(), pt.y()) for _, pt, _, _ in collars])
+        dists_along, offsets = scu.measure_along_line(xy, line_geom, line_start, distance_area)
+
+        hole_ids, points, elevations, depths = zip(*collars)
+        projected_collars = np.empty(len(collars), dtype=PROJECTED_COLLAR_DTYPE)
+        projected_collars["hole_id"] = hole_ids
+        projected_collars["dist"] = dists_along
+        projected_collars["z"] = elevations
+        projected_collars["offset"] = offsets
+        projected_collars["depth"] = depths
+
+        # Keep only collars within the buffer
+        within = np.flatnonzero(projected_collars["offset"] <= buffer_width)
+        projected_collars = projected_collars[within]
+        collar_coords = {hole_ids[i]: points[i] for i in within.tolist()}
+
+        # Missing elevations come from the DEM, read as a single block
+        if dem_layer:
+            pending_dem = np.flatnonzero(projected_collars["z"] == 0.0)
+            if pending_dem.size:
+                sampled = scu.sample_raster_points(
+                    dem_layer, [points[i] for i in within[pending_dem].tolist()]
+                )
+                for i, z in zip(pending_dem.tolist(), sampled):
+                    if z is not None:
+                        projected_collars["z"][i] = z
 
         logger.info(
             f"DrillholeService.project_collars END: Found {len(projected_collars)} collars."
         )
-        return projected_collars
+        return projected_collars, collar_coords
+
+    def _collar_index(
+        self, layer: QgsVectorLayer, attributes: list[str]
+    ) -> Optional[tuple[QgsSpatialIndex, dict[int, QgsFeature]]]:
+        """Return a spatial index of the collar layer, built once per layer version.
+
+        The index is rebuilt when the layer identity or its feature count
+        changes, when other attributes are requested, or after
+        `invalidate_collar_index`. Layers in edit mode are not indexed,
+        since their features can change at any time. Only the most recently
+        built ``_COLLAR_INDEX_MAX_LAYERS`` indexes are kept.
+
+        Args:
+            layer: The collar vector layer.
+            attributes: Names of the attributes the indexed features carry.
+
+        Returns:
+            A tuple of (index, features by ID), or None if the layer is
+            being edited.
+        """
+        if layer.isEditable():
+            return None
+
+        version = (layer_identity(layer), layer.featureCount(), tuple(attributes))
+        with self._collar_index_lock:
+            cached = self._collar_index_cache.get(layer.id())
+        if cached and cached[:3] == version:
+            return cached[3], cached[4]
+
+        request = QgsFeatureRequest().setSubsetOfAttributes(attributes, layer.fields())
+        features = {feat.id(): feat for feat in layer.getFeatures(request)}
+        index = QgsSpatialIndex()
+        index.addFeatures(list(features.values()))
+        logger.debug(f"Built collar spatial index of {len(features)} features for {layer.name()}")
+
+        with self._collar_index_lock:
+            cache = self._collar_index_cache
+            cache.pop(layer.id(), None)
+            cache[layer.id()] = (*version, index, features)
+            while len(cache) > _COLLAR_INDEX_MAX_LAYERS:
+                del cache[next(iter(cache))]
+        return index, features
+
+    @staticmethod
+    def _field_index(fields: QgsFields, name: str) -> Optional[int]:
+        """Resolve a field name to its index for integer attribute lookups.
+
+        Args:
+            fields: Fields of the layer the features come from.
+            name: Field name, possibly empty.
+
+        Returns:
+            The field index, or None if no field name is given.
+        """
+        return fields.indexOf(name) if name else None
 
     def _get_collar_info(
         self,
         feat: QgsFeature,
-        id_field: str,
+        id_index: Optional[int],
         use_geom: bool,
-        x_field: str,
-        y_field: str,
-        z_field: str,
-        depth_field: str,
-        dem_layer: Optional[QgsRasterLayer] = None,
+        x_index: Optional[int],
+        y_index: Optional[int],
+        z_index: Optional[int],
+        depth_index: Optional[int],
     ) -> Optional[tuple[Any, QgsPointXY, float, float]]:
         """Extract collar ID, coordinate, Z and depth from a feature.
 
         Args:
             feat: The collar feature to parse.
-            id_field: Field name for hole ID.
+            id_index: Field index for hole ID.
             use_geom: Whether to use geometry for coordinates.
-            x_field: Field name for X coordinate.
-            y_field: Field name for Y coordinate.
-            z_field: Field name for Z coordinate.
-            depth_field: Field name for total depth.
-            dem_layer: Optional DEM layer for fallback elevation.
+            x_index: Field index for X coordinate.
+            y_index: Field index for Y coordinate.
+            z_index: Field index for Z coordinate.
+            depth_index: Field index for total depth.
 
         Returns:
             A tuple of (hole_id, point, elevation, total_depth) or None if invalid.
         """
-        if not id_field:
+        if id_index is None:
             return None
-        hole_id = feat[id_field]
+        hole_id = feat[id_index]
         x, y, z, depth = 0.0, 0.0, 0.0, 0.0
 
         if use_geom:
@@ -166,8 +292,8 @@ class DrillholeService(IDrillholeService):
             x, y = pt.x(), pt.y()
         else:
             try:
-                x = float(feat[x_field])
-                y = float(feat[y_field])
+                x = float(feat[x_index])
+                y = float(feat[y_index])
             except (ValueError, TypeError):
                 return None
 
@@ -175,36 +301,102 @@ class DrillholeService(IDrillholeService):
             return None
 
         # Z
-        if z_field:
+        if z_index is not None:
             with contextlib.suppress(ValueError, TypeError):
-                z = float(feat[z_field])
-
-        if z == 0.0 and dem_layer:
-            ident = dem_layer.dataProvider().identify(
-                QgsPointXY(x, y), QgsRaster.IdentifyFormatValue
-            )
-            if ident.isValid():
-                val = ident.results().get(1)
-                if val is not None:
-                    z = val
+                z = float(feat[z_index])
 
         # Depth
-        if depth_field:
+        if depth_index is not None:
             with contextlib.suppress(ValueError, TypeError):
-                depth = float(feat[depth_field])
+                depth = float(feat[depth_index])
 
         return hole_id, QgsPointXY(x, y), z, depth
 
+    def preload_tables(
+        self,
+        executor: Executor,
+        survey_layer: Optional[QgsVectorLayer],
+        interval_layer: Optional[QgsVectorLayer],
+        survey_fields: Optional[dict[str, str]] = None,
+        interval_fields: Optional[dict[str, str]] = None,
+    ) -> tuple[Future, Future]:
+        """Start reading the survey and interval tables in the background.
+
+        The reads do not depend on the projected collars, so callers can
+        submit them before `project_collars` and overlap provider I/O with
+        collar projection. Layers are not thread-safe, so a feature source
+        snapshot of each layer is taken on the calling thread (which must
+        own the layers) and only the snapshot is read by the executor.
+        Geometries are never fetched, and only the mapped fields are when
+        field mappings are given.
+
+        Args:
+            executor: Executor the table reads are submitted to.
+            survey_layer: The survey vector layer.
+            interval_layer: The interval/geology vector layer.
+            survey_fields: Optional mapping of survey field roles to field names.
+            interval_fields: Optional mapping of interval field roles to field names.
+
+        Returns:
+            A tuple of futures resolving to the (survey_features,
+            interval_features) lists expected by `process_intervals`.
+        """
+        survey_read = self._feature_request(survey_layer, survey_fields)
+        interval_read = self._feature_request(interval_layer, interval_fields)
+        return (
+            executor.submit(self._fetch_features, *survey_read),
+            executor.submit(self._fetch_features, *interval_read),
+        )
+
+    @staticmethod
+    def _feature_request(
+        layer: Optional[QgsVectorLayer], fields: Optional[dict[str, str]] = None
+    ) -> tuple[Optional[QgsVectorLayerFeatureSource], QgsFeatureRequest]:
+        """Snapshot a layer and build the request reading its mapped attributes.
+
+        Must be called on the thread owning the layer.
+
+        Args:
+            layer: The vector layer to read, or None.
+            fields: Optional mapping of field roles to the field names to fetch.
+
+        Returns:
+            A tuple of (feature source or None if no layer is given, request).
+        """
+        request = QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry)
+        if not layer:
+            return None, request
+        if fields:
+            names = [name for name in fields.values() if name]
+            request.setSubsetOfAttributes(names, layer.fields())
+        return QgsVectorLayerFeatureSource(layer), request
+
+    @staticmethod
+    def _fetch_features(
+        source: Optional[QgsVectorLayerFeatureSource], request: QgsFeatureRequest
+    ) -> list[QgsFeature]:
+        """Read the features of a layer snapshot into a list.
+
+        Safe to call from any thread.
+
+        Args:
+            source: Feature source snapshot of the layer, or None.
+            request: Request selecting the attributes to read.
+
+        Returns:
+            A list of the layer features without geometry, empty if no
+            source is given.
+        """
+        if source is None:
+            return []
+        return list(source.getFeatures(request))
+
     def process_intervals(
         self,
-        collar_points: list[tuple],
-        collar_layer: QgsVectorLayer,
-        survey_layer: QgsVectorLayer,
-        interval_layer: QgsVectorLayer,
-        collar_id_field: str,
-        use_geometry: bool,
-        collar_x_field: str,
-        collar_y_field: str,
+        collar_points: np.ndarray,
+        collar_coords: dict[Any, QgsPointXY],
+        survey_features: list[QgsFeature],
+        interval_features: list[QgsFeature],
         line_geom: QgsGeometry,
         line_start: QgsPointXY,
         distance_area: QgsDistanceArea,
@@ -219,14 +411,10 @@ class DrillholeService(IDrillholeService):
         """Process drillhole interval data and project onto the section.
 
         Args:
-            collar_points: List of projected collar tuples from `project_collars`.
-            collar_layer: The collar vector layer.
-            survey_layer: The survey vector layer.
-            interval_layer: The interval/geology vector layer.
-            collar_id_field: Field name for hole ID in collar layer.
-            use_geometry: Use geometry for collar coordinates.
-            collar_x_field: Field name for X in collar layer.
-            collar_y_field: Field name for Y in collar layer.
+            collar_points: Projected collar array from `project_collars`.
+            collar_coords: Collar point of each hole, from `project_collars`.
+            survey_features: Survey features, as returned by `preload_tables`.
+            interval_features: Interval features, as returned by `preload_tables`.
             line_geom: Section line geometry.
             line_start: Section line start point.
             distance_area: Distance calculation object.
@@ -240,130 +428,164 @@ class DrillholeService(IDrillholeService):
         """
         geol_data, drillhole_data = [], []
 
-        # 1. Build collar coordinate map
-        collar_coords = self._build_collar_coord_map(
-            collar_layer, collar_id_field, use_geometry, collar_x_field, collar_y_field
+        # 1. Group survey and interval rows by hole in a single pass each
+        surveys_by_hole = self._group_survey_data(survey_features, survey_fields)
+        intervals_by_hole, max_interval_depths = self._group_interval_data(
+            interval_features, interval_fields
         )
 
-        for hole_id, _dist, collar_z, _off, given_depth in collar_points:
-            collar_point = collar_coords.get(hole_id)
-            if not collar_point:
+        # 2. Desurvey and project each hole
+        process_hole = partial(
+            self._process_hole,
+            collar_coords=collar_coords,
+            surveys_by_hole=surveys_by_hole,
+            intervals_by_hole=intervals_by_hole,
+            max_interval_depths=max_interval_depths,
+            line_geom=line_geom,
+            line_start=line_start,
+            distance_area=distance_area,
+            buffer_width=buffer_width,
+            section_azimuth=section_azimuth,
+        )
+        for result in map(process_hole, collar_points):
+            if result is None:
                 continue
-
-            # 2. Get Data
-            survey_data = self._get_survey_data(survey_layer, hole_id, survey_fields)
-            intervals = self._get_interval_data(interval_layer, hole_id, interval_fields)
-
-            # 3. Determine Final Depth
-            max_survey_depth = max([s[0] for s in survey_data]) if survey_data else 0.0
-            max_interval_depth = max([i[1] for i in intervals]) if intervals else 0.0
-            final_depth = max(given_depth, max_survey_depth, max_interval_depth)
-
-            # 4. Trajectory and Projection
-            trajectory = scu.calculate_drillhole_trajectory(
-                collar_point, collar_z, survey_data, section_azimuth, total_depth=final_depth
-            )
-            projected_traj = scu.project_trajectory_to_section(
-                trajectory, line_geom, line_start, distance_area
-            )
-
-            # 5. Interpolate Intervals
-            hole_geol_data = self._interpolate_hole_intervals(
-                projected_traj, intervals, buffer_width
-            )
-
-            if hole_geol_data:
-                geol_data.extend(hole_geol_data)
-
-            # 6. Store trace
-            traj_points = [(p[4], p[3]) for p in projected_traj]
+            hole_id, traj_points, hole_geol_data = result
+            geol_data.extend(hole_geol_data)
             drillhole_data.append((hole_id, traj_points, hole_geol_data))
 
         return geol_data, drillhole_data
 
-    def _build_collar_coord_map(self, layer, id_field, use_geom, x_field, y_field):
-        """Build a lookup map for collar coordinates.
+    def _process_hole(
+        self,
+        collar: np.void,
+        collar_coords: dict[Any, QgsPointXY],
+        surveys_by_hole: dict[Any, tuple],
+        intervals_by_hole: dict[Any, list[tuple]],
+        max_interval_depths: dict[Any, float],
+        line_geom: QgsGeometry,
+        line_start: QgsPointXY,
+        distance_area: QgsDistanceArea,
+        buffer_width: float,
+        section_azimuth: float,
+    ) -> Optional[tuple[Any, list[tuple[float, float]], list[GeologySegment]]]:
+        """Desurvey one hole, project it and interpolate its intervals.
 
         Args:
-            layer: The collar vector layer.
-            id_field: Field name for hole ID.
-            use_geom: Whether to use feature geometry.
-            x_field: Field name for X.
-            y_field: Field name for Y.
+            collar: Projected collar row from `project_collars`.
+            collar_coords: Collar point of each hole.
+            surveys_by_hole: Survey arrays of each hole, from `_group_survey_data`.
+            intervals_by_hole: Interval rows of each hole, from `_group_interval_data`.
+            max_interval_depths: Deepest interval of each hole.
+            line_geom: Section line geometry.
+            line_start: Section line start point.
+            distance_area: Distance calculation object.
+            buffer_width: Section buffer width in meters.
+            section_azimuth: Azimuth of the section line.
 
         Returns:
-            A dictionary mapping hole_id to QgsPointXY.
+            A tuple of (hole_id, traj_points, hole_geol_data), or None if the
+            hole has no collar point.
         """
-        if not layer or not id_field:
-            return {}
-        coords = {}
-        for feat in layer.getFeatures():
-            hole_id = feat[id_field]
-            if use_geom:
-                geom = feat.geometry()
-                if geom:
-                    pt = geom.asPoint()
-                    if pt.x() != 0 and pt.y() != 0:
-                        coords[hole_id] = pt
-            else:
-                try:
-                    x, y = float(feat[x_field]), float(feat[y_field])
-                    if x != 0 and y != 0:
-                        coords[hole_id] = QgsPointXY(x, y)
-                except (ValueError, TypeError):
-                    continue
-        return coords
+        hole_id = collar["hole_id"]
+        collar_z = float(collar["z"])
+        given_depth = float(collar["depth"])
+        collar_point = collar_coords.get(hole_id)
+        if not collar_point:
+            return None
 
-    def _get_survey_data(self, layer, hole_id, fields):
-        """Fetch survey data for a specific hole from a survey layer.
+        survey = surveys_by_hole.get(hole_id)
+        intervals = intervals_by_hole.get(hole_id, [])
+
+        # 1. Determine Final Depth
+        # Survey rows are sorted by depth, so the deepest is the last one
+        max_survey_depth = float(survey[0][-1]) if survey else 0.0
+        max_interval_depth = max_interval_depths.get(hole_id, 0.0)
+        final_depth = max(given_depth, max_survey_depth, max_interval_depth)
+
+        # 2. Trajectory and Projection
+        trajectory = scu.calculate_drillhole_trajectory(
+            collar_point,
+            collar_z,
+            [],
+            section_azimuth,
+            total_depth=final_depth,
+            survey_arrays=survey,
+        )
+        projected_traj = scu.project_trajectory_to_section(
+            trajectory, line_geom, line_start, distance_area
+        )
+
+        # 3. Interpolate Intervals
+        hole_geol_data = self._interpolate_hole_intervals(
+            projected_traj, intervals, buffer_width
+        )
+
+        # 4. Trace
+        traj_points = [(p[4], p[3]) for p in projected_traj]
+        return hole_id, traj_points, hole_geol_data
+
+    def _group_survey_data(self, features, fields):
+        """Group survey rows by hole ID.
 
         Args:
-            layer: The survey vector layer.
-            hole_id: The ID of the drillhole.
+            features: Preloaded features of the survey layer.
             fields: Mapping of field roles (id, depth, azim, incl).
 
         Returns:
-            A list of (depth, azimuth, inclination) tuples sorted by depth.
+            A dictionary mapping hole_id to (depths, azimuths, inclinations)
+            float arrays sorted by depth.
         """
-        if not layer or not fields.get("id"):
-            return []
-        data = []
-        for feat in layer.getFeatures():
-            if feat[fields["id"]] == hole_id:
-                try:
-                    d = float(feat[fields["depth"]])
-                    a = float(feat[fields["azim"]])
-                    i = float(feat[fields["incl"]])
-                    data.append((d, a, i))
-                except (ValueError, TypeError):
-                    continue
-        data.sort(key=lambda x: x[0])
-        return data
-
-    def _get_interval_data(self, layer, hole_id, fields):
-        """Fetch interval data for a specific hole from an interval layer.
+        if not features or not fields.get("id"):
+            return {}
+        layer_fields = features[0].fields()
+        id_index, depth_index, azim_index, incl_index = (
+            layer_fields.indexOf(fields[role]) for role in ("id", "depth", "azim", "incl")
+        )
+        grouped = {}
+        for feat in features:
+            try:
+                row = (float(feat[depth_index]), float(feat[azim_index]), float(feat[incl_index]))
+            except (ValueError, TypeError):
+                continue
+            grouped.setdefault(feat[id_index], []).append(row)
+
+        # One (3, n) array per hole, columns sorted by depth
+        for hole_id, rows in grouped.items():
+            data = np.array(rows).T
+            data = data[:, np.argsort(data[0], kind="stable")]
+            grouped[hole_id] = (data[0], data[1], data[2])
+        return grouped
+
+    def _group_interval_data(self, features, fields):
+        """Group interval rows by hole ID.
 
         Args:
-            layer: The interval vector layer.
-            hole_id: The ID of the drillhole.
+            features: Preloaded features of the interval layer.
             fields: Mapping of field roles (id, from, to, lith).
 
         Returns:
-            A list of (from_depth, to_depth, lithology) tuples.
+            A tuple of two dictionaries keyed by hole_id: the list of
+            (from_depth, to_depth, lithology) tuples, and the deepest
+            to_depth of the hole.
         """
-        if not layer or not fields.get("id"):
-            return []
-        data = []
-        for feat in layer.getFeatures():
-            if feat[fields["id"]] == hole_id:
-                try:
-                    fd = float(feat[fields["from"]])
-                    td = float(feat[fields["to"]])
-                    lith = str(feat[fields["lith"]])
-                    data.append((fd, td, lith))
-                except (ValueError, TypeError):
-                    continue
-        return data
+        if not features or not fields.get("id"):
+            return {}, {}
+        layer_fields = features[0].fields()
+        id_index, from_index, to_index, lith_index = (
+            layer_fields.indexOf(fields[role]) for role in ("id", "from", "to", "lith")
+        )
+        grouped, max_depths = {}, {}
+        for feat in features:
+            try:
+                row = (float(feat[from_index]), float(feat[to_index]), str(feat[lith_index]))
+            except (ValueError, TypeError):
+                continue
+            hole_id = feat[id_index]
+            grouped.setdefault(hole_id, []).append(row)
+            if row[1] > max_depths.get(hole_id, 0.0):
+                max_depths[hole_id] = row[1]
+        return grouped, max_depths
 
     def _interpolate_hole_intervals(self, traj, intervals, buffer_width):
         """Interpolate intervals along a trajectory and return GeologySegments.
@@ -385,12 +607,13 @@ class DrillholeService(IDrillholeService):
         ]
         tuples = scu.interpolate_intervals_on_trajectory(traj, rich_intervals, buffer_width)
 
-        segments = []
-        for attr, points in tuples:
-            segments.append(GeologySegment(
+        segment = GeologySegment
+        return [
+            segment(
                 unit_name=str(attr.get("unit", "Unknown")),
                 geometry=None,
                 attributes=attr,
                 points=points,
-            ))
-        return segments
+            )
+            for attr, points in tuples
+        ]
@@ -13,7 +13,7 @@ from typing import Any, Optional
 from qgis.core import QgsMapSettings, QgsProject, QgsRectangle
 
 from sec_interp.core.exceptions import DataMissingError, ExportError
-from sec_interp.core.types import PreviewParams
+from sec_interp.core.types import PreviewParams, ProfileArray, ProfileData
 from sec_interp.logger_config import get_logger
 
 
@@ -35,7 +35,7 @@ class ExportService:
         self,
         output_folder: Path,
         params: PreviewParams,
-        profile_data: list[tuple],
+        profile_data: ProfileData,
         geol_data: Optional[list[Any]],
         struct_data: Optional[list[Any]],
         drillhole_data: Optional[list[Any]] = None,
@@ -45,7 +45,7 @@ class ExportService:
         Args:
             output_folder: Destination directory for all exported files.
             params: Correctly validated parameters for the export run.
-            profile_data: Topographic profile points (dist, elevation).
+            profile_data: Topographic profile (ProfileArray of dist, elevation).
             geol_data: List of GeologySegment objects.
             struct_data: List of StructureMeasurement objects.
             drillhole_data: Optional list of drillhole trace and interval data.
@@ -75,6 +75,10 @@ class ExportService:
         if not profile_data:
             raise DataMissingError("No profile data available for export")
 
+        # The exporters walk the points one by one; give them plain lists
+        if isinstance(profile_data, ProfileArray):
+            profile_data = profile_data.tolist()
+
         line_layer = params.line_layer
         if not line_layer:
             raise DataMissingError("Section line layer not found in parameters")
@@ -38,7 +38,7 @@ from sec_interp.core import utils as scu
 from sec_interp.core.exceptions import DataMissingError, GeometryError, ProcessingError
 from sec_interp.core.interfaces.geology_interface import IGeologyService
 from sec_interp.core.performance_metrics import performance_monitor
-from sec_interp.core.types import GeologyData, GeologySegment
+from sec_interp.core.types import GeologyData, GeologySegment, OutcropIntersection
 from sec_interp.core.utils.resource_manager import temporary_memory_layer
 from sec_interp.core.utils.sampling import interpolate_elevation
 from sec_interp.logger_config import get_logger
@@ -83,31 +83,41 @@ class GeologyService(IGeologyService):
             GeometryError: If the line geometry is invalid.
             ProcessingError: If the intersection processing fails.
         """
-        line_feat = next(line_lyr.getFeatures(), None)
-        if not line_feat:
-            raise DataMissingError("Line layer has no features", {"layer": line_lyr.name()})
+        line_geom, line_start = self._get_line_start(line_lyr)
+        intersections = self.compute_intersections(
+            line_lyr, line_start, outcrop_lyr, outcrop_name_field
+        )
+        return self.sample_elevations(
+            line_lyr, line_geom, line_start, raster_lyr, intersections, band_number
+        )
 
-        line_geom = line_feat.geometry()
-        if not line_geom or line_geom.isNull():
-            raise GeometryError("Line geometry is not valid", {"layer": line_lyr.name()})
+    def compute_intersections(
+        self,
+        line_lyr: QgsVectorLayer,
+        line_start: QgsPointXY,
+        outcrop_lyr: QgsVectorLayer,
+        outcrop_name_field: str,
+    ) -> list[OutcropIntersection]:
+        """Intersect the section line with outcrop polygons.
 
-        if line_geom.isMultipart():
-            line_start = line_geom.asMultiPolyline()[0][0]
-        else:
-            line_start = line_geom.asPolyline()[0]
+        The result does not depend on the DEM, so it can be cached and
+        reused across raster and band changes.
 
-        crs = line_lyr.crs()
-        da = scu.create_distance_area(crs)
+        Args:
+            line_lyr: The QGIS vector layer representing the cross-section line.
+            line_start: Start point of the section line.
+            outcrop_lyr: The QGIS vector layer containing geological outcrop polygons.
+            outcrop_name_field: The attribute field name for geological unit names.
 
-        # 1. Generate Master Profile Data
-        master_profile_data, master_grid_dists = self._generate_master_profile_data(
-            line_geom, raster_lyr, band_number, da, line_start
-        )
+        Returns:
+            A list of `OutcropIntersection` objects, sorted by distance along the section.
 
-        # 2. Run Intersection & 3. Process Intersections
-        segments = []
-        tolerance = 0.001
+        Raises:
+            ProcessingError: If the intersection processing fails.
+        """
+        da = scu.create_distance_area(line_lyr.crs())
 
+        intersections = []
         # Execute intersection and manage its lifecycle
         with self._intersect_to_temp_layer(line_lyr, outcrop_lyr) as intersection_layer:
             if not intersection_layer or not intersection_layer.isValid():
@@ -115,23 +125,85 @@ class GeologyService(IGeologyService):
                 return []
 
             for feature in intersection_layer.getFeatures():
-                new_segments = self._process_intersection_feature(
-                    feature,
-                    outcrop_name_field,
-                    line_start,
-                    da,
-                    master_grid_dists,
-                    master_profile_data,
-                    tolerance,
+                intersections.extend(
+                    self._process_intersection_feature(
+                        feature, outcrop_name_field, line_start, da
+                    )
                 )
-                segments.extend(new_segments)
 
-        logger.info(f"Generated {len(segments)} geological segments")
-        # Sort by start distance
-        segments.sort(key=lambda x: x.points[0][0] if x.points else 0)
+        intersections.sort(key=lambda x: x.dist_start)
+        return intersections
 
+    def sample_elevations(
+        self,
+        line_lyr: QgsVectorLayer,
+        line_geom: QgsGeometry,
+        line_start: QgsPointXY,
+        raster_lyr: QgsRasterLayer,
+        intersections: list[OutcropIntersection],
+        band_number: int = 1,
+    ) -> GeologyData:
+        """Sample DEM elevations along precomputed outcrop intersections.
+
+        Args:
+            line_lyr: The QGIS vector layer representing the cross-section line.
+            line_geom: Geometry of the section line.
+            line_start: Start point of the section line.
+            raster_lyr: The Digital Elevation Model (DEM) raster layer.
+            intersections: Intersections returned by `compute_intersections`.
+            band_number: The raster band to use for elevation sampling (default 1).
+
+        Returns:
+            GeologyData: A list of `GeologySegment` objects, sorted by distance along the section.
+        """
+        if not intersections:
+            return []
+
+        da = scu.create_distance_area(line_lyr.crs())
+
+        master_profile_data, master_grid_dists = self._generate_master_profile_data(
+            line_geom, raster_lyr, band_number, da, line_start
+        )
+
+        tolerance = 0.001
+        segments = [
+            self._create_segment(
+                intersection, master_grid_dists, master_profile_data, tolerance
+            )
+            for intersection in intersections
+        ]
+
+        logger.info(f"Generated {len(segments)} geological segments")
         return segments
 
+    def _get_line_start(self, line_lyr: QgsVectorLayer) -> tuple[QgsGeometry, QgsPointXY]:
+        """Return the section line geometry and its start point.
+
+        Args:
+            line_lyr: The QGIS vector layer representing the cross-section line.
+
+        Returns:
+            A tuple of (line geometry, start point).
+
+        Raises:
+            DataMissingError: If the line layer has no features.
+            GeometryError: If the line geometry is invalid.
+        """
+        line_feat = next(line_lyr.getFeatures(), None)
+        if not line_feat:
+            raise DataMissingError("Line layer has no features", {"layer": line_lyr.name()})
+
+        line_geom = line_feat.geometry()
+        if not line_geom or line_geom.isNull():
+            raise GeometryError("Line geometry is not valid", {"layer": line_lyr.name()})
+
+        if line_geom.isMultipart():
+            line_start = line_geom.asMultiPolyline()[0][0]
+        else:
+            line_start = line_geom.asPolyline()[0]
+
+        return line_geom, line_start
+
     def _generate_master_profile_data(
         self,
         line_geom: QgsGeometry,
@@ -231,23 +303,17 @@ class GeologyService(IGeologyService):
         outcrop_name_field: str,
         line_start: QgsPointXY,
         da: QgsDistanceArea,
-        master_grid_dists: list,
-        master_profile_data: list,
-        tolerance: float,
-    ) -> list[GeologySegment]:
-        """Process a single intersection feature to extract geology segments.
+    ) -> list[OutcropIntersection]:
+        """Process a single intersection feature to extract outcrop intersections.
 
         Args:
             feature: The intersection result feature.
             outcrop_name_field: The field name for geological unit names.
             line_start: Start point of the section line.
             da: Geodesic distance calculation object.
-            master_grid_dists: Master grid elevation data for sampling.
-            master_profile_data: Master profile data for boundary interpolation.
-            tolerance: Small distance tolerance for grid point inclusion.
 
         Returns:
-            A list of GeologySegment objects extracted from the feature.
+            A list of OutcropIntersection objects extracted from the feature.
         """
         geom = feature.geometry()
         if not geom or geom.isNull():
@@ -270,35 +336,25 @@ class GeologyService(IGeologyService):
         except KeyError:
             glg_val = "Unknown"
 
-        segments = []
+        intersections = []
         for seg_geom in geometries:
-            segment = self._create_segment_from_geometry(
-                seg_geom,
-                feature,
-                str(glg_val),
-                line_start,
-                da,
-                master_grid_dists,
-                master_profile_data,
-                tolerance,
+            intersection = self._create_intersection_from_geometry(
+                seg_geom, feature, str(glg_val), line_start, da
             )
-            if segment:
-                segments.append(segment)
+            if intersection:
+                intersections.append(intersection)
 
-        return segments
+        return intersections
 
-    def _create_segment_from_geometry(
+    def _create_intersection_from_geometry(
         self,
         seg_geom: QgsGeometry,
         feature: QgsFeature,
         glg_val: str,
         line_start: QgsPointXY,
         da: QgsDistanceArea,
-        master_grid_dists: list,
-        master_profile_data: list,
-        tolerance: float,
-    ) -> Optional[GeologySegment]:
-        """Create a GeologySegment from a geometry part by sampling elevations.
+    ) -> Optional[OutcropIntersection]:
+        """Create an OutcropIntersection from a geometry part.
 
         Args:
             seg_geom: The part geometry to process.
@@ -306,12 +362,9 @@ class GeologyService(IGeologyService):
             glg_val: The geology unit name for this segment.
             line_start: Start point of the section line.
             da: Geodesic distance calculation object.
-            master_grid_dists: Master grid elevation data.
-            master_profile_data: Master profile topography data.
-            tolerance: Geometrical distance tolerance.
 
         Returns:
-            A new GeologySegment object, or None if the geometry has no vertices.
+            A new OutcropIntersection object, or None if the geometry has no vertices.
         """
         verts = scu.get_line_vertices(seg_geom)
         if not verts:
@@ -325,6 +378,37 @@ class GeologyService(IGeologyService):
         if dist_start > dist_end:
             dist_start, dist_end = dist_end, dist_start
 
+        # Attributes from original feature
+        attrs = dict(zip(feature.fields().names(), feature.attributes(), strict=False))
+
+        return OutcropIntersection(
+            unit_name=glg_val,
+            geometry=seg_geom,
+            attributes=attrs,
+            dist_start=dist_start,
+            dist_end=dist_end,
+        )
+
+    def _create_segment(
+        self,
+        intersection: OutcropIntersection,
+        master_grid_dists: list,
+        master_profile_data: list,
+        tolerance: float,
+    ) -> GeologySegment:
+        """Create a GeologySegment from an intersection by sampling elevations.
+
+        Args:
+            intersection: The outcrop intersection to sample.
+            master_grid_dists: Master grid elevation data.
+            master_profile_data: Master profile topography data.
+            tolerance: Geometrical distance tolerance.
+
+        Returns:
+            A new GeologySegment object.
+        """
+        dist_start, dist_end = intersection.dist_start, intersection.dist_end
+
         # Get Inner Grid Points
         inner_points = [
             (d, e)
@@ -339,12 +423,9 @@ class GeologyService(IGeologyService):
         # Combine
         segment_points = [(dist_start, elev_start), *inner_points, (dist_end, elev_end)]
 
-        # Attributes from original feature
-        attrs = dict(zip(feature.fields().names(), feature.attributes(), strict=False))
-
         return GeologySegment(
-            unit_name=glg_val,
-            geometry=seg_geom,
-            attributes=attrs,
+            unit_name=intersection.unit_name,
+            geometry=intersection.geometry,
+            attributes=intersection.attributes,
             points=[(round(d, 1), round(e, 1)) for d, e in segment_points],
         )
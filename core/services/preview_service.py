@@ -189,8 +189,32 @@ class PreviewService:
         distance_area = QgsDistanceArea()
         distance_area.setSourceCrs(params.line_layer.crs(), self.transform_context)
 
+        survey_fields = {
+            "id": params.survey_id_field,
+            "depth": params.survey_depth_field,
+            "azim": params.survey_azim_field,
+            "incl": params.survey_incl_field,
+        }
+
+        interval_fields = {
+            "id": params.interval_id_field,
+            "from": params.interval_from_field,
+            "to": params.interval_to_field,
+            "lith": params.interval_lith_field,
+        }
+
+        drillhole_service = self.controller.drillhole_service
+        # Survey and interval reads do not depend on the collars
+        future_surveys, future_intervals = drillhole_service.preload_tables(
+            self.controller.io_executor,
+            params.survey_layer,
+            params.interval_layer,
+            survey_fields,
+            interval_fields,
+        )
+
         try:
-            projected_collars = self.controller.drillhole_service.project_collars(
+            projected_collars, collar_coords = drillhole_service.project_collars(
                 collar_layer=params.collar_layer,
                 line_geom=line_geom,
                 line_start=line_start,
@@ -206,35 +230,22 @@ class PreviewService:
                 line_crs=params.line_layer.crs(),
             )
         except Exception as e:
+            future_surveys.cancel()
+            future_intervals.cancel()
             raise ProcessingError("Failed to project drillhole collars", {"hole_id_field": params.collar_id_field}) from e
 
-        if not projected_collars:
+        if not len(projected_collars):
+            # The table reads are no longer needed
+            future_surveys.cancel()
+            future_intervals.cancel()
             return None
 
-        survey_fields = {
-            "id": params.survey_id_field,
-            "depth": params.survey_depth_field,
-            "azim": params.survey_azim_field,
-            "incl": params.survey_incl_field,
-        }
-
-        interval_fields = {
-            "id": params.interval_id_field,
-            "from": params.interval_from_field,
-            "to": params.interval_to_field,
-            "lith": params.interval_lith_field,
-        }
-
         try:
-            _, drillhole_data = self.controller.drillhole_service.process_intervals(
+            _, drillhole_data = drillhole_service.process_intervals(
                 collar_points=projected_collars,
-                collar_layer=params.collar_layer,
-                survey_layer=params.survey_layer,
-                interval_layer=params.interval_layer,
-                collar_id_field=params.collar_id_field,
-                use_geometry=params.collar_use_geometry,
-                collar_x_field=params.collar_x_field,
-                collar_y_field=params.collar_y_field,
+                collar_coords=collar_coords,
+                survey_features=future_surveys.result(),
+                interval_features=future_intervals.result(),
                 line_geom=line_geom,
                 line_start=line_start,
                 distance_area=distance_area,
@@ -19,12 +19,13 @@
 
 from typing import Optional
 
+import numpy as np
 from qgis.core import QgsPointXY, QgsRasterLayer, QgsVectorLayer
 
 from sec_interp.core import utils as scu
 from sec_interp.core.exceptions import DataMissingError, GeometryError
 from sec_interp.core.interfaces.profile_interface import IProfileService
-from sec_interp.core.types import ProfileData
+from sec_interp.core.types import ProfileArray, ProfileData
 from sec_interp.logger_config import get_logger
 
 
@@ -54,7 +55,7 @@ class ProfileService(IProfileService):
             interval: Optional sampling interval. If None, uses raster resolution.
 
         Returns:
-            A list of (distance, elevation) tuples representing the profile.
+            A ProfileArray of (distance, elevation) samples representing the profile.
 
         Raises:
             DataMissingError: If line layer has no features.
@@ -76,7 +77,10 @@ class ProfileService(IProfileService):
             geom, raster_lyr, band_number, da, interval=interval
         )
 
-        # Convert QgsPointXY to tuples
-        values = [(round(p.x(), 1), round(p.y(), 1)) for p in points]
-
-        return values
+        # Convert QgsPointXY to a single (N, 2) array rounded to 0.1 units
+        coords = np.fromiter(
+            (c for p in points for c in (p.x(), p.y())),
+            dtype=np.float64,
+            count=2 * len(points),
+        )
+        return ProfileArray(np.round(coords, 1))
@@ -21,13 +21,12 @@ from __future__ import annotations
 from collections.abc import Iterator
 from typing import Optional
 
+import numpy as np
 from qgis.core import (
     QgsCoordinateReferenceSystem,
-    QgsDistanceArea,
     QgsFeature,
     QgsGeometry,
     QgsPointXY,
-    QgsRaster,
     QgsRasterLayer,
     QgsVectorLayer,
 )
@@ -109,23 +108,28 @@ class StructureService(IStructureService):
 
         # 3. Process Features
         projected_structs = []
+        struct_points = []
         crs = struct_lyr.crs()
         da = scu.create_distance_area(crs)
 
         for f in filtered_features:
-            measurement = self._process_single_structure(
-                f,
-                line_geom,
-                line_start,
-                da,
-                raster_lyr,
-                band_number,
-                line_az,
-                dip_field,
-                strike_field,
-            )
-            if measurement:
-                projected_structs.append(measurement)
+            result = self._process_single_structure(f, line_az, dip_field, strike_field)
+            if result:
+                projected_structs.append(result[0])
+                struct_points.append(result[1])
+
+        # 4. Project all structures onto the line at once for their stations
+        xy = np.array([(pt.x(), pt.y()) for pt in struct_points]).reshape(-1, 2)
+        nearest, dists_along, _ = scu.project_points_to_line(xy, line_geom, line_start, da)
+        for measurement, dist in zip(projected_structs, dists_along.tolist()):
+            measurement.distance = round(dist, 1)
+
+        # 5. Sample elevations of all projected points in one raster read
+        elevations = scu.sample_raster_points(
+            raster_lyr, [QgsPointXY(x, y) for x, y in nearest.tolist()], band_number
+        )
+        for measurement, elev in zip(projected_structs, elevations):
+            measurement.elevation = round(elev if elev is not None else 0.0, 1)
 
         # Sort by distance
         projected_structs.sort(key=lambda x: x.distance)
@@ -186,55 +190,32 @@ class StructureService(IStructureService):
     def _process_single_structure(
         self,
         feature: QgsFeature,
-        line_geom: QgsGeometry,
-        line_start: QgsPointXY,
-        da: QgsDistanceArea,
-        raster_lyr: QgsRasterLayer,
-        band_number: int,
         line_az: float,
         dip_field: str,
         strike_field: str,
-    ) -> Optional[StructureMeasurement]:
-        """Process a single structure feature to calculate its 2D coordinates and apparent dip.
+    ) -> Optional[tuple[StructureMeasurement, QgsPointXY]]:
+        """Parse a single structure feature and calculate its apparent dip.
+
+        Distance and elevation are left at 0.0; the caller projects the
+        returned points of all structures onto the section line at once.
 
         Args:
             feature: The source structural point feature.
-            line_geom: The section line geometry.
-            line_start: The start point of the section line.
-            da: The distance calculation object.
-            raster_lyr: The DEM layer for elevation sampling.
-            band_number: The raster band index.
             line_az: The azimuth of the section line.
             dip_field: Field name for original dip.
             strike_field: Field name for original strike.
 
         Returns:
-            The projected measurement object, or None if invalid or cannot be projected.
+            A tuple of (measurement, structure point), or None if invalid.
         """
         struct_geom = feature.geometry()
         if not struct_geom or struct_geom.isNull():
             return None
-
-        # Project point onto line to get true station distance
-        proj_dist = line_geom.lineLocatePoint(struct_geom)
-        if proj_dist < 0:
+        try:
+            struct_pt = struct_geom.asPoint()
+        except TypeError:
             return None
 
-        # Interpolate point on line at that distance
-        proj_pt = line_geom.interpolate(proj_dist).asPoint()
-
-        # Measure geodesic distance from start
-        # Using measureLine ensures correct units (meters) even if CRS is geographic
-        dist = da.measureLine(line_start, proj_pt)
-
-        # Sample Elevation
-        res_val = (
-            raster_lyr.dataProvider()
-            .identify(proj_pt, QgsRaster.IdentifyFormatValue)
-            .results()
-        )
-        elev = res_val.get(band_number, 0.0)
-
         # Parse Attributes
         try:
             strike_raw = feature[strike_field]
@@ -255,9 +236,9 @@ class StructureService(IStructureService):
         app_dip = scu.calculate_apparent_dip(strike, dip_angle, line_az)
 
         # Create object
-        return StructureMeasurement(
-            distance=round(dist, 1),
-            elevation=round(elev, 1),
+        measurement = StructureMeasurement(
+            distance=0.0,
+            elevation=0.0,
             apparent_dip=round(app_dip, 1),
             original_dip=dip_angle,
             original_strike=strike,
@@ -265,3 +246,4 @@ class StructureService(IStructureService):
                 zip(feature.fields().names(), feature.attributes(), strict=False)
             ),
         )
+        return measurement, struct_pt
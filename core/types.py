@@ -2,9 +2,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import IntEnum
+from functools import cached_property
+import hashlib
+import os
+import struct
 from typing import Any, Optional, Protocol, runtime_checkable
 
-from qgis.core import QgsGeometry, QgsPointXY, QgsRasterLayer, QgsVectorLayer
+import numpy as np
+from qgis.core import (
+    QgsGeometry,
+    QgsMapLayer,
+    QgsPointXY,
+    QgsRasterLayer,
+    QgsVectorLayer,
+)
 
 from sec_interp.core.exceptions import ConfigurationError, ValidationError
 from sec_interp.core.performance_metrics import MetricsCollector
@@ -74,7 +85,7 @@ class StructureMeasurement:
     attributes: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class GeologySegment:
     """Represents a geological unit segment along the profile.
 
@@ -91,16 +102,268 @@ class GeologySegment:
     points: list[tuple[float, float]]
 
 
+@dataclass
+class OutcropIntersection:
+    """Part of the section line crossing an outcrop polygon.
+
+    Holds only what the line/outcrop intersection yields, so it can be
+    reused when the elevation source or band changes.
+
+    Attributes:
+        unit_name: Name of the geological unit.
+        geometry: QGIS geometry of the intersected line part.
+        attributes: Dictionary containing original feature attributes.
+        dist_start: Distance along the section to the start of the part.
+        dist_end: Distance along the section to the end of the part.
+    """
+
+    unit_name: str
+    geometry: QgsGeometry
+    attributes: dict[str, Any]
+    dist_start: float
+    dist_end: float
+
+
+class ProfileArray:
+    """Topographic profile stored as a single (N, 2) float64 NumPy array.
+
+    Behaves like the list of ``(distance, elevation)`` tuples it replaces
+    (``len``, truth value, indexing and iteration yield plain Python floats),
+    while holding the samples in one contiguous buffer instead of N tuples.
+    Per-element access builds a tuple on every call, so hot paths should use
+    the ``distances`` and ``elevations`` column views, or ``tolist()`` when
+    they need the points as Python objects.
+    """
+
+    # __weakref__ lets caches share identical profiles through weak references
+    __slots__ = ("_data", "__weakref__")
+
+    def __init__(self, data: Any) -> None:
+        """Initialize from an (N, 2) array-like of (distance, elevation) pairs.
+
+        Args:
+            data: Array-like convertible to a float64 array of shape (N, 2).
+        """
+        arr = np.asarray(data, dtype=np.float64)
+        self._data = arr.reshape(-1, 2)
+
+    @property
+    def array(self) -> np.ndarray:
+        """Underlying (N, 2) float64 array."""
+        return self._data
+
+    @property
+    def distances(self) -> np.ndarray:
+        """Distance column view."""
+        return self._data[:, 0]
+
+    @property
+    def elevations(self) -> np.ndarray:
+        """Elevation column view."""
+        return self._data[:, 1]
+
+    def tolist(self) -> list[list[float]]:
+        """Return the samples as a list of ``[distance, elevation]`` lists."""
+        return self._data.tolist()
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        # Lets np.asarray() take the buffer instead of iterating the points
+        if dtype is None and not copy:
+            return self._data
+        return np.array(self._data, dtype=dtype, copy=True)
+
+    def __len__(self) -> int:
+        return self._data.shape[0]
+
+    def __bool__(self) -> bool:
+        return self._data.shape[0] > 0
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return ProfileArray(self._data[index])
+        return tuple(self._data[index].tolist())
+
+    def __iter__(self):
+        return map(tuple, self._data.tolist())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ProfileArray):
+            return np.array_equal(self._data, other._data)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self) -> tuple:
+        # Pickle as the bare array for the persistent cache tier
+        return (ProfileArray, (self._data,))
+
+    def __repr__(self) -> str:
+        return f"ProfileArray({len(self)} points)"
+
+
 # Final type aliases for processed data
 StructureData = list[StructureMeasurement]
 GeologyData = list[GeologySegment]
-ProfileData = list[tuple[float, float]]
+ProfileData = ProfileArray
+
+# Row layout of the projected collars returned by DrillholeService.project_collars
+PROJECTED_COLLAR_DTYPE = np.dtype(
+    [
+        ("hole_id", object),
+        ("dist", "f8"),
+        ("z", "f8"),
+        ("offset", "f8"),
+        ("depth", "f8"),
+    ]
+)
+
+
+try:
+    import xxhash
+
+    def _fast_digest(data: bytes) -> str:
+        """Return a fast non-cryptographic hex digest of ``data``."""
+        return xxhash.xxh3_64(data).hexdigest()
+
+except ImportError:
+    # Fallback without xxhash
+    def _fast_digest(data: bytes) -> str:
+        """Return a fast non-cryptographic hex digest of ``data``."""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# Canonical byte encoders for cache key parts, dispatched on the exact type.
+# Each encoding is prefixed with a type tag so values of different types
+# never collide (e.g. "1" vs 1 vs 1.0 vs True).
+_KEY_PART_ENCODERS = {
+    str: lambda v: b"s" + v.encode("utf-8"),
+    float: lambda v: b"f" + struct.pack("<d", v),
+    int: lambda v: b"i" + v.to_bytes(8, "little", signed=True),
+    bool: lambda v: b"b\x01" if v else b"b\x00",
+    type(None): lambda v: b"n",
+}
+
+
+def _source_mtime(layer: QgsMapLayer) -> Optional[float]:
+    """Return the modification time of a layer's source file.
+
+    Args:
+        layer: The QGIS layer.
+
+    Returns:
+        The file modification time, or None for database, web or in-memory
+        sources, which have no reliable version signal.
+    """
+    path = layer.source().split("|", 1)[0]
+    try:
+        return os.path.getmtime(path)
+    except (OSError, ValueError):
+        return None
 
 
-@dataclass
+def layer_identity(layer: QgsMapLayer) -> str:
+    """Return an identity for a layer's data that survives layer reloads.
+
+    Layer IDs change when the same file is added to a project again, so
+    the data source is used instead. File-based sources include the file
+    modification time, so entries built from an older version of the file
+    are not reused. Vector subset filters are included since they change
+    the features a layer returns. A vector layer with unsaved edits gets
+    an identity of its own, so results built from its saved data are not
+    served while the edit buffer differs from it.
+
+    Args:
+        layer: The QGIS layer to identify.
+
+    Returns:
+        A string identifying the layer's data source and its version.
+    """
+    mtime = _source_mtime(layer) or 0.0
+    subset = layer.subsetString() if isinstance(layer, QgsVectorLayer) else ""
+    identity = f"{layer.source()}\x1f{mtime!r}\x1f{subset}"
+    if isinstance(layer, QgsVectorLayer) and layer.isModified():
+        identity += f"\x1fmodified:{layer.id()}"
+    return identity
+
+
+def has_persistent_identity(layer: QgsMapLayer) -> bool:
+    """Return whether `layer_identity` tracks every change to a layer's data.
+
+    Only file-based sources without unsaved edits qualify. Results depending
+    on other layers must not outlive the session, since changes committed
+    outside QGIS or pending in the edit buffer would go unnoticed.
+
+    Args:
+        layer: The QGIS layer to check.
+
+    Returns:
+        True if results built from the layer can be persisted.
+    """
+    if _source_mtime(layer) is None:
+        return False
+    return not (isinstance(layer, QgsVectorLayer) and layer.isModified())
+
+
+def _encode_key_part(val: Any) -> bytes:
+    """Encode a single cache key part as canonical bytes.
+
+    Args:
+        val: Parameter value (layer, scalar, or any object with a stable repr).
+
+    Returns:
+        Type-tagged byte encoding of the value.
+    """
+    encoder = _KEY_PART_ENCODERS.get(type(val))
+    if encoder is not None:
+        try:
+            return encoder(val)
+        except OverflowError:
+            # Integers wider than 64 bits
+            pass
+    if isinstance(val, QgsMapLayer):
+        return b"L" + layer_identity(val).encode("utf-8")
+    return b"r" + repr(val).encode("utf-8")
+
+
+def encode_key_parts(values: tuple[Any, ...]) -> bytes:
+    """Encode a canonical tuple of parameter values as bytes.
+
+    Layers are identified by `layer_identity` and scalars by a fixed
+    binary encoding, so the result does not depend on ``str``/``repr``
+    formatting.
+
+    Args:
+        values: Parameter values relevant to a single processing phase.
+
+    Returns:
+        The separator-joined, type-tagged encoding of the values.
+    """
+    return b"\x1f".join(_encode_key_part(val) for val in values)
+
+
+def hash_key_parts(values: tuple[Any, ...]) -> str:
+    """Hash a canonical tuple of parameter values into a cache sub-key.
+
+    The key only identifies cache entries, so a fast non-cryptographic hash
+    is sufficient; entries can be checked against `encode_key_parts` to
+    rule out collisions.
+
+    Args:
+        values: Parameter values relevant to a single processing phase.
+
+    Returns:
+        The hex digest identifying the parameter subset.
+    """
+    return _fast_digest(encode_key_parts(values))
+
+
+@dataclass(frozen=True)
 class PreviewParams:
     """Consolidated parameters for profile generation and preview.
 
+    Instances are immutable so the per-phase cache keys can be computed once
+    and memoized on the instance.
+
     Attributes:
         raster_layer: QGIS raster layer for DEM sampling.
         line_layer: QGIS vector layer for the section orientation.
@@ -204,6 +467,86 @@ class PreviewParams:
         if self.interval_layer and self.interval_layer.isValid() and not all([self.interval_id_field, self.interval_from_field, self.interval_to_field, self.interval_lith_field]):
             raise ValidationError("Interval layer selected but some required fields are missing.")
 
+    @cached_property
+    def line_geometry(self) -> Optional[QgsGeometry]:
+        """Geometry of the first section line feature, read once per parameter set."""
+        line_feat = next(self.line_layer.getFeatures(), None)
+        return line_feat.geometry() if line_feat else None
+
+    @cached_property
+    def line_signature(self) -> str:
+        """Digest of the section line WKB.
+
+        Identifies the section geometry itself rather than the Python wrapper
+        QGIS returns, so cache keys stay stable across feature reads.
+        """
+        geom = self.line_geometry
+        if geom is None or geom.isNull():
+            return ""
+        return _fast_digest(bytes(geom.asWkb()))
+
+    @cached_property
+    def key_fingerprints(self) -> dict[str, bytes]:
+        """Canonical encoding of the inputs behind each phase cache key.
+
+        Stored next to cached entries so a lookup can reject a digest
+        collision instead of returning another parameter set's result.
+        """
+        return {
+            "topo": encode_key_parts((
+                self.raster_layer, self.line_layer, self.line_signature,
+                self.band_num, self.max_points,
+            )),
+            "geol": encode_key_parts((
+                self.line_layer, self.line_signature, self.raster_layer,
+                self.outcrop_layer, self.outcrop_name_field, self.band_num,
+            )),
+            "geol_isect": encode_key_parts((
+                self.line_layer, self.line_signature,
+                self.outcrop_layer, self.outcrop_name_field,
+            )),
+            "struct": encode_key_parts((
+                self.line_layer, self.line_signature, self.raster_layer,
+                self.struct_layer, self.buffer_dist, self.dip_field, self.strike_field,
+                self.band_num,
+            )),
+            "drill": encode_key_parts((
+                self.line_layer, self.line_signature, self.raster_layer,
+                self.collar_layer, self.survey_layer,
+                self.interval_layer, self.buffer_dist, self.collar_id_field,
+                self.collar_use_geometry, self.collar_x_field, self.collar_y_field,
+                self.collar_z_field, self.collar_depth_field, self.survey_id_field,
+                self.survey_depth_field, self.survey_azim_field, self.survey_incl_field,
+                self.interval_id_field, self.interval_from_field, self.interval_to_field,
+                self.interval_lith_field,
+            )),
+        }
+
+    @cached_property
+    def topo_key(self) -> str:
+        """Cache sub-key for the topographic profile phase."""
+        return _fast_digest(self.key_fingerprints["topo"])
+
+    @cached_property
+    def geol_key(self) -> str:
+        """Cache sub-key for the geological profile phase."""
+        return _fast_digest(self.key_fingerprints["geol"])
+
+    @cached_property
+    def geol_isect_key(self) -> str:
+        """Cache sub-key for the band-independent outcrop intersections."""
+        return _fast_digest(self.key_fingerprints["geol_isect"])
+
+    @cached_property
+    def struct_key(self) -> str:
+        """Cache sub-key for the structural projection phase."""
+        return _fast_digest(self.key_fingerprints["struct"])
+
+    @cached_property
+    def drill_key(self) -> str:
+        """Cache sub-key for the drillhole projection phase."""
+        return _fast_digest(self.key_fingerprints["drill"])
+
 
 @dataclass
 class PreviewResult:
@@ -233,7 +576,7 @@ class PreviewResult:
         """
         elevations = []
         if self.topo:
-            elevations.extend(p[1] for p in self.topo)
+            elevations.extend(self.topo.elevations.tolist())
         if self.geol:
             for segment in self.geol:
                 elevations.extend(p[1] for p in segment.points)
@@ -259,4 +602,5 @@ class PreviewResult:
         """
         if not self.topo:
             return 0.0, 0.0
-        return self.topo[0][0], self.topo[-1][0]
+        distances = self.topo.distances
+        return float(distances[0]), float(distances[-1])
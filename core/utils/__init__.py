@@ -57,6 +57,7 @@ from .sampling import (
     interpolate_elevation,
     prepare_profile_context,
     sample_elevation_along_line,
+    sample_raster_points,
 )
 
 # Spatial calculations
@@ -65,6 +66,9 @@ from .spatial import (
     calculate_step_size,
     create_distance_area,
     get_line_start_point,
+    measure_along_line,
+    nearest_points_on_polyline,
+    project_points_to_line,
 )
 
 
@@ -94,12 +98,16 @@ __all__ = [
     "get_line_vertices",
     "interpolate_elevation",
     "interpolate_intervals_on_trajectory",
+    "measure_along_line",
+    "nearest_points_on_polyline",
     "parse_dip",
     # Parsing
     "parse_strike",
     "prepare_profile_context",
+    "project_points_to_line",
     "project_trajectory_to_section",
     "run_processing_algorithm",
     # Sampling
     "sample_elevation_along_line",
+    "sample_raster_points",
 ]
@@ -3,9 +3,11 @@
 Calculations for drillhole geometry and projection.
 """
 
+from bisect import bisect_left, bisect_right
 import math
-from typing import Any
+from typing import Any, Optional
 
+import numpy as np
 from qgis.core import QgsDistanceArea, QgsGeometry, QgsPointXY
 
 
@@ -16,11 +18,14 @@ def calculate_drillhole_trajectory(
     section_azimuth: float,
     densify_step: float = 1.0,
     total_depth: float = 0.0,
+    survey_arrays: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
 ) -> list[tuple[float, float, float, float, float, float]]:
     """Calculate 3D trajectory of a drillhole using survey data.
 
     Uses the tangential method for trajectory calculation with densification
     to generate intermediate points for continuous interval projection.
+    Survey columns given as ``survey_arrays`` are processed with array
+    operations instead of row by row.
 
     Args:
         collar_point: QgsPointXY of collar location (X, Y).
@@ -30,6 +35,8 @@ def calculate_drillhole_trajectory(
         densify_step: Distance in meters between interpolated points (default 1.0m).
         total_depth: Optional total depth. If greater than last survey depth,
                      trajectory will be extrapolated using last orientation.
+        survey_arrays: Optional (depths, azimuths, inclinations) arrays sorted
+            by depth. If given, ``survey_data`` is ignored.
 
     Returns:
         A list of tuples (depth, x, y, z, dist_along_section, offset_from_section):
@@ -38,6 +45,11 @@ def calculate_drillhole_trajectory(
             - dist_along_section: Distance along the section line (initially 0.0).
             - offset_from_section: Perpendicular distance from section line (initially 0.0).
     """
+    if survey_arrays is not None:
+        return _calculate_trajectory_from_arrays(
+            collar_point, collar_z, survey_arrays, densify_step, total_depth
+        )
+
     if not survey_data:
         if total_depth > 0:
             # No survey but depth provided: assume vertical hole
@@ -141,6 +153,81 @@ def calculate_drillhole_trajectory(
     return trajectory
 
 
+def _calculate_trajectory_from_arrays(
+    collar_point: QgsPointXY,
+    collar_z: float,
+    survey_arrays: tuple[np.ndarray, np.ndarray, np.ndarray],
+    densify_step: float,
+    total_depth: float,
+) -> list[tuple[float, float, float, float, float, float]]:
+    """Array-based equivalent of `calculate_drillhole_trajectory`.
+
+    Args:
+        collar_point: QgsPointXY of collar location (X, Y).
+        collar_z: Elevation of collar (Z).
+        survey_arrays: (depths, azimuths, inclinations) arrays sorted by depth.
+        densify_step: Distance in meters between interpolated points.
+        total_depth: Depth to extrapolate the trajectory to, if deeper than
+            the last survey.
+
+    Returns:
+        The trajectory tuples, as returned by `calculate_drillhole_trajectory`.
+    """
+    depths, azimuths, inclinations = survey_arrays
+    if not len(depths):
+        if total_depth <= 0:
+            return []
+        # No survey but depth provided: assume vertical hole
+        depths, azimuths, inclinations = np.zeros(1), np.zeros(1), np.full(1, -90.0)
+
+    # A survey row starts a segment only if it is deeper than every row
+    # (and the collar) before it
+    reached = np.maximum.accumulate(np.concatenate(([0.0], depths)))[:-1]
+    keep = depths > reached
+    seg_start = reached[keep]
+    seg_len = depths[keep] - seg_start
+
+    # Tangential method: -90° inclination is vertical down
+    incl_rad = np.radians(90 + inclinations[keep])
+    azim_rad = np.radians(azimuths[keep])
+    horizontal = seg_len * np.sin(incl_rad)
+    seg_dx = horizontal * np.sin(azim_rad)
+    seg_dy = horizontal * np.cos(azim_rad)
+    seg_dz = -seg_len * np.cos(incl_rad)
+
+    # Extrapolate below the last survey using its orientation
+    last_depth = depths[-1]
+    if total_depth > last_depth:
+        interval = total_depth - last_depth
+        last_incl = math.radians(90 + inclinations[-1])
+        last_azim = math.radians(azimuths[-1])
+        seg_start = np.append(seg_start, last_depth)
+        seg_len = np.append(seg_len, interval)
+        seg_dx = np.append(seg_dx, interval * math.sin(last_incl) * math.sin(last_azim))
+        seg_dy = np.append(seg_dy, interval * math.sin(last_incl) * math.cos(last_azim))
+        seg_dz = np.append(seg_dz, -interval * math.cos(last_incl))
+
+    # Segment origins, accumulated in survey order from the collar
+    x0 = np.cumsum(np.concatenate(([collar_point.x()], seg_dx)))[:-1]
+    y0 = np.cumsum(np.concatenate(([collar_point.y()], seg_dy)))[:-1]
+    z0 = np.cumsum(np.concatenate(([collar_z], seg_dz)))[:-1]
+
+    # Densify: each segment gets num_steps points at i / num_steps
+    num_steps = np.maximum(1, (seg_len / densify_step).astype(np.int64))
+    seg = np.repeat(np.arange(len(num_steps)), num_steps)
+    first = np.cumsum(num_steps) - num_steps
+    fraction = (np.arange(len(seg)) - first[seg] + 1) / num_steps[seg]
+
+    n = len(seg) + 1
+    columns = np.zeros((6, n))
+    columns[:4, 0] = 0.0, collar_point.x(), collar_point.y(), collar_z
+    columns[0, 1:] = seg_start[seg] + seg_len[seg] * fraction
+    columns[1, 1:] = x0[seg] + seg_dx[seg] * fraction
+    columns[2, 1:] = y0[seg] + seg_dy[seg] * fraction
+    columns[3, 1:] = z0[seg] + seg_dz[seg] * fraction
+    return list(zip(*columns.tolist()))
+
+
 def project_trajectory_to_section(
     trajectory: list[tuple],
     line_geom: QgsGeometry,
@@ -162,25 +249,17 @@ def project_trajectory_to_section(
             - dist_along: Projected distance along the section line.
             - offset: Perpendicular offset from the section line.
     """
-    projected = []
-
-    for depth, x, y, z, _, _ in trajectory:
-        point = QgsPointXY(x, y)
-        point_geom = QgsGeometry.fromPointXY(point)
-
-        # Find nearest point on line
-        nearest_point = line_geom.nearestPoint(point_geom)
-        nearest_pt_xy = nearest_point.asPoint()
+    from .spatial import measure_along_line
 
-        # Calculate distance along section
-        dist_along = distance_area.measureLine(line_start, nearest_pt_xy)
+    xy = np.array([(x, y) for _, x, y, _, _, _ in trajectory]).reshape(-1, 2)
+    dist_along, offset = measure_along_line(xy, line_geom, line_start, distance_area)
 
-        # Calculate offset from section
-        offset = distance_area.measureLine(point, nearest_pt_xy)
-
-        projected.append((depth, x, y, z, dist_along, offset))
-
-    return projected
+    return [
+        (depth, x, y, z, along, off)
+        for (depth, x, y, z, _, _), along, off in zip(
+            trajectory, dist_along.tolist(), offset.tolist()
+        )
+    ]
 
 
 def interpolate_intervals_on_trajectory(
@@ -205,14 +284,24 @@ def interpolate_intervals_on_trajectory(
     """
     geol_segments = []
 
-    for from_depth, to_depth, attribute in intervals:
-        # Find trajectory points within this interval
-        interval_points = []
+    # Trajectories are built in depth order, so each interval covers a
+    # contiguous run of points that can be found by bisection
+    depths = [point[0] for point in trajectory]
+    ordered = all(a <= b for a, b in zip(depths, depths[1:]))
 
-        for depth, _x, _y, z, dist_along, offset in trajectory:
-            # Check if point is within interval and buffer
-            if from_depth <= depth <= to_depth and offset <= buffer_width:
-                interval_points.append((dist_along, z))
+    for from_depth, to_depth, attribute in intervals:
+        if ordered:
+            lo = bisect_left(depths, from_depth)
+            hi = bisect_right(depths, to_depth)
+        else:
+            lo, hi = 0, len(trajectory)
+
+        # Find trajectory points within this interval and buffer
+        interval_points = [
+            (dist_along, z)
+            for depth, _x, _y, z, dist_along, offset in trajectory[lo:hi]
+            if from_depth <= depth <= to_depth and offset <= buffer_width
+        ]
 
         # Add segment if we have points
         if interval_points:
@@ -23,13 +23,23 @@ def filter_features_by_buffer(
     features_layer: QgsVectorLayer,
     buffer_geometry: QgsGeometry,
     buffer_crs: QgsCoordinateReferenceSystem | None = None,
+    attributes: list[str] | None = None,
+    feature_index: tuple[QgsSpatialIndex, dict[int, QgsFeature]] | None = None,
 ) -> list[QgsFeature]:
     """Filter features that intersect with buffer using spatial index.
 
+    Candidates are limited to the buffer's bounding box by the data
+    provider, then tested against the buffer prepared once for repeated
+    intersection tests.
+
     Args:
         features_layer: Layer containing features to filter.
         buffer_geometry: Buffer geometry to use for spatial filter.
         buffer_crs: CRS of the buffer geometry (optional).
+        attributes: Names of the only attributes to fetch (optional, all
+            attributes are fetched by default).
+        feature_index: Optional prebuilt spatial index of the layer and its
+            features by ID, queried instead of the data provider.
 
     Returns:
         List of QgsFeature objects that intersect the query buffer.
@@ -49,22 +59,30 @@ def filter_features_by_buffer(
         query_geom = QgsGeometry(buffer_geometry)
         query_geom.transform(transform)
 
-    # 2. Build Spatial Index (Optimized for repeated queries)
-    index = QgsSpatialIndex(features_layer.getFeatures())
-
-    # 3. Get candidates using Bounding Box (Fast R-tree lookup)
-    candidate_ids = index.intersects(query_geom.boundingBox())
-
-    # 4. Precise filtering
+    # 2. Bounding box prefilter, served by the given or the provider's spatial index
+    if feature_index is not None:
+        index, features_by_id = feature_index
+        candidates = [features_by_id[fid] for fid in index.intersects(query_geom.boundingBox())]
+    else:
+        request = QgsFeatureRequest().setFilterRect(query_geom.boundingBox())
+        if attributes is not None:
+            request.setSubsetOfAttributes(attributes, features_layer.fields())
+        candidates = features_layer.getFeatures(request)
+
+    # 3. Precise filtering against the prepared buffer polygon
+    engine = QgsGeometry.createGeometryEngine(query_geom.constGet())
+    engine.prepareGeometry()
+
+    candidate_count = 0
     filtered_features = []
-    if candidate_ids:
-        request = QgsFeatureRequest().setFilterFids(candidate_ids)
-        for feature in features_layer.getFeatures(request):
-            if feature.geometry().intersects(query_geom):
-                filtered_features.append(feature)
+    for feature in candidates:
+        candidate_count += 1
+        geom = feature.geometry()
+        if not geom.isNull() and engine.intersects(geom.constGet()):
+            filtered_features.append(feature)
 
     logger.debug(
-        f"Spatial Index: {len(candidate_ids)} candidates -> {len(filtered_features)} confirmed"
+        f"Spatial filter: {candidate_count} candidates -> {len(filtered_features)} confirmed"
     )
 
     return filtered_features
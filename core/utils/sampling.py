@@ -8,11 +8,13 @@ This module provides elevation sampling and profile context preparation tools.
 
 from typing import Any, Optional
 
+import numpy as np
 from qgis.core import (
     QgsDistanceArea,
     QgsGeometry,
     QgsPointXY,
     QgsRasterLayer,
+    QgsRectangle,
     QgsVectorLayer,
 )
 
@@ -21,6 +23,9 @@ from sec_interp.logger_config import get_logger
 
 logger = get_logger(__name__)
 
+# Largest raster window (in cells) read in one block by `sample_raster_points`
+_MAX_BLOCK_CELLS = 4_000_000
+
 
 def sample_elevation_along_line(
     geometry: QgsGeometry,
@@ -84,6 +89,72 @@ def sample_elevation_along_line(
     return points
 
 
+def sample_raster_points(
+    raster_layer: QgsRasterLayer,
+    points: list[QgsPointXY],
+    band_number: int = 1,
+) -> list[Optional[float]]:
+    """Sample raster values at many points with a single block read.
+
+    The pixels covering all points are read as one raster block, so the
+    provider decodes each tile once instead of once per point. If that
+    window would exceed ``_MAX_BLOCK_CELLS``, points are sampled one by one.
+
+    Args:
+        raster_layer: The source raster layer.
+        points: Points in the raster CRS.
+        band_number: The raster band index to sample.
+
+    Returns:
+        The value at each point, or None where the point is outside the
+        raster or on a no-data pixel.
+    """
+    values: list[Optional[float]] = [None] * len(points)
+    if not points:
+        return values
+
+    provider = raster_layer.dataProvider()
+    extent = raster_layer.extent()
+    px = raster_layer.rasterUnitsPerPixelX()
+    py = raster_layer.rasterUnitsPerPixelY()
+    x_min, y_max = extent.xMinimum(), extent.yMaximum()
+
+    xs = np.fromiter((pt.x() for pt in points), dtype=float, count=len(points))
+    ys = np.fromiter((pt.y() for pt in points), dtype=float, count=len(points))
+    inside = (
+        (xs >= x_min) & (xs < extent.xMaximum()) & (ys > extent.yMinimum()) & (ys <= y_max)
+    )
+    if not inside.any():
+        return values
+
+    # Pixel indices in the full raster grid
+    cols = np.floor((xs - x_min) / px).astype(np.int64)
+    rows = np.floor((y_max - ys) / py).astype(np.int64)
+    c0, c1 = int(cols[inside].min()), int(cols[inside].max())
+    r0, r1 = int(rows[inside].min()), int(rows[inside].max())
+    width, height = c1 - c0 + 1, r1 - r0 + 1
+
+    if width * height > _MAX_BLOCK_CELLS:
+        for i in np.flatnonzero(inside):
+            val, ok = provider.sample(points[i], band_number)
+            values[i] = val if ok else None
+        return values
+
+    window = QgsRectangle(
+        x_min + c0 * px, y_max - (r1 + 1) * py, x_min + (c1 + 1) * px, y_max - r0 * py
+    )
+    block = provider.block(band_number, window, width, height)
+    if not block.isValid():
+        logger.warning(f"Could not read raster block from {raster_layer.name()}")
+        return values
+
+    for i in np.flatnonzero(inside):
+        row, col = int(rows[i]) - r0, int(cols[i]) - c0
+        if not block.isNoData(row, col):
+            values[i] = block.value(row, col)
+    return values
+
+
 def prepare_profile_context(
     line_lyr: QgsVectorLayer,
 ) -> tuple[QgsGeometry, QgsPointXY, QgsDistanceArea]:
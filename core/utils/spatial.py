@@ -5,6 +5,7 @@ Distance calculations, azimuth, and basic spatial operations.
 
 import math
 
+import numpy as np
 from qgis.core import (
     QgsCoordinateReferenceSystem,
     QgsDistanceArea,
@@ -106,11 +107,120 @@ def get_line_start_point(geometry: QgsGeometry) -> QgsPointXY:
     return geometry.asPolyline()[0]
 
 
+def nearest_points_on_polyline(points: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+    """Find the closest point on a planar polyline for many points at once.
+
+    Every point is projected onto every segment in a single array operation,
+    and the closest projection is kept.
+
+    Args:
+        points: Array of shape (N, 2) with the x, y coordinates of each point.
+        vertices: Array of shape (M, 2) with the polyline vertices (M >= 1).
+
+    Returns:
+        Array of shape (N, 2) with the nearest point on the polyline.
+    """
+    if len(vertices) == 1:
+        return np.repeat(vertices, len(points), axis=0)
+
+    starts = vertices[:-1]
+    deltas = vertices[1:] - starts
+    lengths_sq = np.einsum("ij,ij->i", deltas, deltas)
+    rel = points[:, None, :] - starts[None, :, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.einsum("nsk,sk->ns", rel, deltas) / lengths_sq
+    # Zero-length segments give NaN and collapse to their start vertex
+    t = np.clip(np.nan_to_num(t), 0.0, 1.0)
+    proj = starts[None, :, :] + t[..., None] * deltas[None, :, :]
+    dist_sq = ((points[:, None, :] - proj) ** 2).sum(axis=2)
+    return proj[np.arange(len(points)), dist_sq.argmin(axis=1)]
+
+
+def project_points_to_line(
+    xy: np.ndarray,
+    line_geom: QgsGeometry,
+    line_start: QgsPointXY,
+    distance_area: QgsDistanceArea,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Project points onto a section line and measure them along it.
+
+    On a single-part line the nearest points are found for all points at
+    once with planar vector math, as `nearestPoint` does. Distances use the
+    same metric as the topographic profile: ``distance_area.measureLine``
+    whenever it uses an ellipsoid, planar norms otherwise. Since
+    `create_distance_area` sets the CRS ellipsoid, the vectorized distances
+    only apply to CRSs without one.
+
+    Args:
+        xy: Array of shape (N, 2) with the x, y coordinates of each point.
+        line_geom: Geometry of the section line.
+        line_start: Start point of the section line.
+        distance_area: Distance calculation object for the line CRS.
+
+    Returns:
+        A tuple of (nearest, dist_along, offset) arrays: the (N, 2) nearest
+        point on the line to each point, the distance from the line start
+        to it, and the distance from the point to it.
+    """
+    from .geometry import get_line_vertices
+
+    if not len(xy):
+        return np.empty((0, 2)), np.empty(0), np.empty(0)
+
+    if line_geom.isMultipart():
+        nearest = np.empty((len(xy), 2))
+        for i, (x, y) in enumerate(xy.tolist()):
+            point = line_geom.nearestPoint(QgsGeometry.fromPointXY(QgsPointXY(x, y))).asPoint()
+            nearest[i] = (point.x(), point.y())
+    else:
+        vertices = np.array([(v.x(), v.y()) for v in get_line_vertices(line_geom)])
+        nearest = nearest_points_on_polyline(xy, vertices)
+
+    if not distance_area.willUseEllipsoid():
+        dist_along = np.hypot(*(nearest - (line_start.x(), line_start.y())).T)
+        offset = np.hypot(*(xy - nearest).T)
+        return nearest, dist_along, offset
+
+    dist_along, offset = np.empty(len(xy)), np.empty(len(xy))
+    for i, ((x, y), (nx, ny)) in enumerate(zip(xy.tolist(), nearest.tolist())):
+        nearest_point = QgsPointXY(nx, ny)
+        dist_along[i] = distance_area.measureLine(line_start, nearest_point)
+        offset[i] = distance_area.measureLine(QgsPointXY(x, y), nearest_point)
+    return nearest, dist_along, offset
+
+
+def measure_along_line(
+    xy: np.ndarray,
+    line_geom: QgsGeometry,
+    line_start: QgsPointXY,
+    distance_area: QgsDistanceArea,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Measure where points fall along a section line and how far off it.
+
+    See `project_points_to_line`, which also returns the nearest points.
+
+    Args:
+        xy: Array of shape (N, 2) with the x, y coordinates of each point.
+        line_geom: Geometry of the section line.
+        line_start: Start point of the section line.
+        distance_area: Distance calculation object for the line CRS.
+
+    Returns:
+        A tuple of (dist_along, offset) arrays: the distance from the line
+        start to each point's nearest point on the line, and the distance
+        from the point to it.
+    """
+    _, dist_along, offset = project_points_to_line(xy, line_geom, line_start, distance_area)
+    return dist_along, offset
+
+
 def create_distance_area(crs: QgsCoordinateReferenceSystem) -> QgsDistanceArea:
     """Helper to create and configure a QgsDistanceArea object.
 
     Configures the distance area with the provided CRS, project transform context,
-    and associated ellipsoid for geodesic calculations.
+    and associated ellipsoid for geodesic calculations. A new instance is
+    built on every call, so it always reflects the current project's
+    transform context and is never shared between runs.
 
     Args:
         crs: The Coordinate Reference System to use.
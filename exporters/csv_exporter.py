@@ -25,7 +25,7 @@ class CSVExporter(BaseExporter):
         Args:
             output_path: Output file path.
             data: A dictionary containing 'headers' (list of strings)
-                  and 'rows' (list of tuples or lists).
+                  and 'rows' (any iterable of tuples or lists).
 
         Returns:
             True if export successful, False otherwise
@@ -44,6 +44,7 @@ class DrillholeTraceShpExporter(BaseExporter):
 
             writer = scu.create_shapefile_writer(str(output_path), crs, fields)
 
+            features = []
             for hole_id, traces, _ in drillhole_data:
                 if not traces or len(traces) < 2:
                     continue
@@ -58,7 +59,10 @@ class DrillholeTraceShpExporter(BaseExporter):
                 feat = QgsFeature(fields)
                 feat.setGeometry(geom)
                 feat.setAttribute("hole_id", hole_id)
-                writer.addFeature(feat)
+                features.append(feat)
+
+            # Hand all features to the provider in a single call
+            writer.addFeatures(features)
 
         except Exception:
             logger.exception(f"Failed to export drillhole traces to {output_path}")
@@ -94,6 +98,7 @@ class DrillholeIntervalShpExporter(BaseExporter):
 
             writer = scu.create_shapefile_writer(str(output_path), crs, fields)
 
+            features = []
             for hole_id, _, segments in drillhole_data:
                 if not segments:
                     continue
@@ -120,7 +125,10 @@ class DrillholeIntervalShpExporter(BaseExporter):
                     feat.setAttribute("to_depth", attrs.get("to", 0.0))
                     feat.setAttribute("unit", segment.unit_name)
 
-                    writer.addFeature(feat)
+                    features.append(feat)
+
+            # Hand all features to the provider in a single call
+            writer.addFeatures(features)
 
         except Exception:
             logger.exception(f"Failed to export drillhole intervals to {output_path}")
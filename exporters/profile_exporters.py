@@ -89,10 +89,15 @@ class GeologyShpExporter(BaseExporter):
             fields = self._create_geology_fields(geology_data)
             writer = scu.create_shapefile_writer(str(output_path), crs, fields)
 
-            for segment in geology_data:
-                feat = self._create_geology_feature(segment, fields)
-                if feat:
-                    writer.addFeature(feat)
+            features = [
+                feat
+                for feat in (
+                    self._create_geology_feature(segment, fields)
+                    for segment in geology_data
+                )
+                if feat
+            ]
+            writer.addFeatures(features)
 
         except Exception:
             logger.exception(f"Failed to export geology profile to {output_path}")
@@ -158,10 +163,15 @@ class StructureShpExporter(BaseExporter):
             fields = self._create_structure_fields(structural_data)
             writer = scu.create_shapefile_writer(str(output_path), crs, fields)
 
-            for m in structural_data:
-                feat = self._create_structure_feature(m, fields, line_length)
-                if feat:
-                    writer.addFeature(feat)
+            features = [
+                feat
+                for feat in (
+                    self._create_structure_feature(m, fields, line_length)
+                    for m in structural_data
+                )
+                if feat
+            ]
+            writer.addFeatures(features)
 
             del writer
         except Exception:
@@ -262,12 +272,13 @@ class AxesShpExporter(BaseExporter):
             writer = scu.create_shapefile_writer(str(output_path), crs, fields)
 
             axis_names = ["Left", "Right", "Bottom"]
-            for i, points in enumerate(lines):
+            features = []
+            for name, points in zip(axis_names, lines):
                 feat = QgsFeature()
-                geom = QgsGeometry.fromPolylineXY(points)
-                feat.setGeometry(geom)
-                feat.setAttributes([axis_names[i]])
-                writer.addFeature(feat)
+                feat.setGeometry(QgsGeometry.fromPolylineXY(points))
+                feat.setAttributes([name])
+                features.append(feat)
+            writer.addFeatures(features)
 
         except Exception:
             logger.exception(f"Failed to export axes to {output_path}")
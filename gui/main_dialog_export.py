@@ -14,6 +14,7 @@ from qgis.PyQt.QtCore import QSize
 from qgis.PyQt.QtGui import QColor
 from qgis.PyQt.QtWidgets import QFileDialog
 
+from sec_interp.core.controller import format_messages
 from sec_interp.core.exceptions import ExportError, SecInterpError
 from sec_interp.core.performance_metrics import MetricsCollector, PerformanceTimer
 from sec_interp.core.services.export_service import ExportService
@@ -175,7 +176,7 @@ class ExportManager:
             self.dialog.preview_widget.results_text.setPlainText(
                 "✓ Generating data for export..."
             )
-            profile_data, geol_data, struct_data, drillhole_data, _ = (
+            profile_data, geol_data, struct_data, drillhole_data, messages = (
                 self.dialog.plugin_instance.controller.generate_profile_data(params)
             )
 
@@ -194,7 +195,10 @@ class ExportManager:
                 drillhole_data,
             )
 
-            self.dialog.preview_widget.results_text.setPlainText("\n".join(result_msg))
+            # Processing notes and warnings first, then the exported files
+            self.dialog.preview_widget.results_text.setPlainText(
+                "\n".join([*format_messages(messages), "", *result_msg])
+            )
         except SecInterpError as e:
             self.dialog.handle_error(e, "Data Export Error")
             return False
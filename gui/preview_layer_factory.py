@@ -25,7 +25,12 @@ from qgis.core import (
 )
 from qgis.PyQt.QtGui import QColor
 
-from sec_interp.core.types import GeologyData, ProfileData, StructureData
+from sec_interp.core.types import (
+    GeologyData,
+    ProfileArray,
+    ProfileData,
+    StructureData,
+)
 from sec_interp.logger_config import get_logger
 
 from .preview_optimizer import PreviewOptimizer
@@ -224,7 +229,10 @@ class PreviewLayerFactory:
             line_length = dip_line_length
         else:
             if reference_data:
-                elevs = [e for _, e in reference_data]
+                if isinstance(reference_data, ProfileArray):
+                    elevs = reference_data.elevations.tolist()
+                else:
+                    elevs = [e for _, e in reference_data]
                 e_range = max(elevs) - min(elevs)
             else:
                 e_range = 100
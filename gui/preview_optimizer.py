@@ -6,10 +6,12 @@ Handles simplification and sampling of geometric data to improve rendering perfo
 from __future__ import annotations
 
 import math
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
 from qgis.core import QgsGeometry, QgsPointXY
 
+from sec_interp.core.types import ProfileArray
 from sec_interp.logger_config import get_logger
 
 
@@ -21,20 +23,22 @@ class PreviewOptimizer:
 
     @staticmethod
     def decimate(
-        data: list[tuple[float, float]],
+        data: Any,
         tolerance: Optional[float] = None,
         max_points: int = 1000,
     ) -> list[tuple[float, float]]:
         """Decimate line data using Douglas-Peucker algorithm.
 
         Args:
-            data: List of (x, y) tuples
+            data: List of (x, y) tuples or a ProfileArray
             tolerance: Simplification tolerance (if provided, overrides max_points heuristic)
             max_points: Maximum points to keep (approximate target if tolerance is None)
 
         Returns:
-            Decimated list of (x, y) tuples
+            Decimated list of (x, y) points
         """
+        if isinstance(data, ProfileArray):
+            data = data.tolist()
         if not data or len(data) <= max_points:
             return data
 
@@ -74,57 +78,45 @@ class PreviewOptimizer:
             return result
 
     @staticmethod
-    def calculate_curvature(data: list[tuple[float, float]]) -> list[float]:
+    def calculate_curvature(data: Any) -> list[float]:
         """Calculate a simple curvature metric for each point in a line.
 
         This approximates curvature by the angle deviation between successive segments.
         High values indicate sharper turns.
 
         Args:
-            data: List of (x, y) tuples.
+            data: List of (x, y) tuples or a ProfileArray.
 
         Returns:
             List of curvature values (angles in degrees), same length as data.
         """
-        if len(data) < 3:
-            return [0.0] * len(data)
-
-        curvatures = [0.0]  # First point has no preceding segment
-        for i in range(1, len(data) - 1):
-            p_prev = data[i - 1]
-            p_curr = data[i]
-            p_next = data[i + 1]
-
-            # Vectors for segments
-            v1_x = p_curr[0] - p_prev[0]
-            v1_y = p_curr[1] - p_prev[1]
-            v2_x = p_next[0] - p_curr[0]
-            v2_y = p_next[1] - p_curr[1]
-
-            # Dot product and magnitudes
-            dot_product = v1_x * v2_x + v1_y * v2_y
-            mag_v1 = math.sqrt(v1_x**2 + v1_y**2)
-            mag_v2 = math.sqrt(v2_x**2 + v2_y**2)
-
-            if mag_v1 == 0 or mag_v2 == 0:
-                angle = 0.0
-            else:
-                # Angle between vectors
-                cosine_angle = dot_product / (mag_v1 * mag_v2)
-                # Clamp to avoid NaN from floating point inaccuracies
-                cosine_angle = max(-1.0, min(1.0, cosine_angle))
-                angle = math.degrees(math.acos(cosine_angle))
+        points = np.asarray(data, dtype=np.float64).reshape(-1, 2)
+        if len(points) < 3:
+            return [0.0] * len(points)
+
+        # Vectors for the segments before and after each interior point
+        segments = np.diff(points, axis=0)
+        v1 = segments[:-1]
+        v2 = segments[1:]
 
-            # Angle deviation from 180 (straight line)
-            curvatures.append(abs(180 - angle))
+        # Dot product and magnitudes
+        dot_product = v1[:, 0] * v2[:, 0] + v1[:, 1] * v2[:, 1]
+        mag_v1 = np.sqrt(v1[:, 0] ** 2 + v1[:, 1] ** 2)
+        mag_v2 = np.sqrt(v2[:, 0] ** 2 + v2[:, 1] ** 2)
+        degenerate = (mag_v1 == 0) | (mag_v2 == 0)
 
-        curvatures.append(0.0)  # Last point has no succeeding segment
-        return curvatures
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Clamp to avoid NaN from floating point inaccuracies
+            cosine_angle = np.clip(dot_product / (mag_v1 * mag_v2), -1.0, 1.0)
+            angle = np.where(degenerate, 0.0, np.degrees(np.arccos(cosine_angle)))
+
+        # Angle deviation from 180 (straight line); end points have no turn
+        return [0.0, *np.abs(180 - angle).tolist(), 0.0]
 
     @classmethod
     def adaptive_sample(
         cls,
-        data: list[tuple[float, float]],
+        data: Any,
         min_tolerance: float = 0.1,
         max_tolerance: float = 10.0,
         max_points: int = 1000,
@@ -132,7 +124,7 @@ class PreviewOptimizer:
         """Adaptively sample data based on local curvature.
 
         Args:
-            data: List of (x, y) tuples
+            data: List of (x, y) tuples or a ProfileArray
             min_tolerance: Minimum tolerance for high-detail areas
             max_tolerance: Maximum tolerance for low-detail areas
             max_points: Maximum points to keep (approximate target)
@@ -141,7 +133,7 @@ class PreviewOptimizer:
             Adaptively sampled data
         """
         if len(data) <= max_points:
-            return data
+            return data.tolist() if isinstance(data, ProfileArray) else data
 
         # Calculate local curvature
         curvatures = cls.calculate_curvature(data)
@@ -57,6 +57,26 @@ logger = get_logger(__name__)
 
 # DataCache has been moved to core/data_cache.py
 
+# Dialog values passed to PreviewParams unchanged under the same name
+_PASSTHROUGH_FIELDS = (
+    "outcrop_name_field",
+    "dip_field",
+    "strike_field",
+    "collar_id_field",
+    "collar_x_field",
+    "collar_y_field",
+    "collar_z_field",
+    "collar_depth_field",
+    "survey_id_field",
+    "survey_depth_field",
+    "survey_azim_field",
+    "survey_incl_field",
+    "interval_id_field",
+    "interval_from_field",
+    "interval_to_field",
+    "interval_lith_field",
+)
+
 
 class SecInterp:
     """QGIS Plugin Implementation for Geological Data Extraction.
@@ -280,46 +300,29 @@ class SecInterp:
         # Get preview/LOD options from the preview widget
         preview_options = self.dlg.get_preview_options()
 
+        get = values.get
+        resolve = self._resolve_layer_obj
+
         # 1. Resolve Layer Objects
-        raster_layer = self._resolve_layer_obj(
-            values.get("raster_layer"), self.tr("Select a raster layer")
-        )
-        line_layer = self._resolve_layer_obj(
-            values.get("crossline_layer"), self.tr("Select a crossline layer")
-        )
-        outcrop_layer = self._resolve_layer_obj(values.get("outcrop_layer"))
-        structural_layer = self._resolve_layer_obj(values.get("structural_layer"))
+        raster_layer = resolve(get("raster_layer"), self.tr("Select a raster layer"))
+        line_layer = resolve(get("crossline_layer"), self.tr("Select a crossline layer"))
+        field_values = {name: get(name) for name in _PASSTHROUGH_FIELDS}
 
         # 2. Build PreviewParams
         try:
             params = PreviewParams(
                 raster_layer=raster_layer,
                 line_layer=line_layer,
-                band_num=values.get("selected_band", 1),
-                buffer_dist=values.get("buffer_distance", 100.0),
-                outcrop_layer=outcrop_layer,
-                outcrop_name_field=values.get("outcrop_name_field"),
-                struct_layer=structural_layer,
-                dip_field=values.get("dip_field"),
-                strike_field=values.get("strike_field"),
-                dip_scale_factor=values.get("dip_scale_factor", 1.0),
-                collar_layer=self._resolve_layer_obj(values.get("collar_layer_obj")),
-                collar_id_field=values.get("collar_id_field"),
-                collar_use_geometry=values.get("collar_use_geometry", True),
-                collar_x_field=values.get("collar_x_field"),
-                collar_y_field=values.get("collar_y_field"),
-                collar_z_field=values.get("collar_z_field"),
-                collar_depth_field=values.get("collar_depth_field"),
-                survey_layer=self._resolve_layer_obj(values.get("survey_layer_obj")),
-                survey_id_field=values.get("survey_id_field"),
-                survey_depth_field=values.get("survey_depth_field"),
-                survey_azim_field=values.get("survey_azim_field"),
-                survey_incl_field=values.get("survey_incl_field"),
-                interval_layer=self._resolve_layer_obj(values.get("interval_layer_obj")),
-                interval_id_field=values.get("interval_id_field"),
-                interval_from_field=values.get("interval_from_field"),
-                interval_to_field=values.get("interval_to_field"),
-                interval_lith_field=values.get("interval_lith_field"),
+                band_num=get("selected_band", 1),
+                buffer_dist=get("buffer_distance", 100.0),
+                outcrop_layer=resolve(get("outcrop_layer")),
+                struct_layer=resolve(get("structural_layer")),
+                dip_scale_factor=get("dip_scale_factor", 1.0),
+                collar_layer=resolve(get("collar_layer_obj")),
+                collar_use_geometry=get("collar_use_geometry", True),
+                survey_layer=resolve(get("survey_layer_obj")),
+                interval_layer=resolve(get("interval_layer_obj")),
+                **field_values,
                 max_points=preview_options.get("max_points", 1000),
                 auto_lod=preview_options.get("auto_lod", True),
                 canvas_width=self.dlg.preview_widget.canvas.width(),
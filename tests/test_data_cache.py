@@ -0,0 +1,70 @@
+"""Tests for the bucket size limits of core.data_cache."""
+
+from __future__ import annotations
+
+import pytest
+
+
+pytest.importorskip("qgis.core")
+
+from sec_interp.core.data_cache import DataCache  # noqa: E402
+
+
+def _miss_distinct_keys(cache, bucket, prefix, count=20):
+    """Look up and store keys that are never requested again."""
+    for i in range(count):
+        assert cache.get(bucket, (prefix, i)) is None
+        cache.set(bucket, (prefix, i), i)
+
+
+def test_rebalance_shrinks_bucket_without_hits():
+    """A bucket that never serves hits is halved down to one entry."""
+    cache = DataCache(max_entries=4)
+
+    _miss_distinct_keys(cache, "topo", 0)
+    assert cache.rebalance() == {"topo": 2}
+    assert cache.get_cache_size()["topo"] == 2
+
+    _miss_distinct_keys(cache, "topo", 1)
+    assert cache.rebalance() == {"topo": 1}
+
+    _miss_distinct_keys(cache, "topo", 2)
+    assert cache.rebalance() == {}
+    assert cache.stats()["topo"]["limit"] == 1
+
+
+def test_rebalance_grows_shrunk_bucket_back():
+    """Switching between two sections restores the limit of a shrunk bucket."""
+    cache = DataCache(max_entries=4)
+    for prefix in range(2):
+        _miss_distinct_keys(cache, "topo", prefix)
+        cache.rebalance()
+    assert cache.stats()["topo"]["limit"] == 1
+
+    def alternate():
+        for _ in range(10):
+            for key in ("a", "b"):
+                if cache.get("topo", key) is None:
+                    cache.set("topo", key, key)
+
+    # At one entry every lookup misses, but on a key the limit evicted
+    alternate()
+    assert cache.stats()["topo"]["hits"] == 0
+    assert cache.rebalance() == {"topo": 2}
+
+    # Both sections now fit; only the one evicted before growing misses
+    alternate()
+    assert cache.stats()["topo"]["hits"] == 19
+    assert cache.rebalance() == {"topo": 4}
+    assert cache.stats()["topo"]["limit"] == 4
+
+
+def test_rebalance_keeps_full_limit_for_busy_bucket():
+    """A bucket with a good hit rate is left at ``max_entries``."""
+    cache = DataCache(max_entries=4)
+    cache.set("geol", "key", "value")
+    for _ in range(20):
+        assert cache.get("geol", "key") == "value"
+
+    assert cache.rebalance() == {}
+    assert cache.stats()["geol"]["limit"] == 4
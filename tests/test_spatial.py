@@ -0,0 +1,151 @@
+"""Regression tests for section line measurement in core.utils.spatial."""
+
+from __future__ import annotations
+
+import pytest
+
+
+qgis_core = pytest.importorskip("qgis.core")
+gdal = pytest.importorskip("osgeo.gdal")
+
+import numpy as np  # noqa: E402
+
+from sec_interp.core import utils as scu  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qgis_app():
+    """Initialize QGIS once so CRS and ellipsoid definitions are available."""
+    app = qgis_core.QgsApplication([], False)
+    app.initQgis()
+    yield app
+    app.exitQgis()
+
+
+def _write_dem(path, crs, origin, size, pixel):
+    """Write a flat single-band GeoTIFF covering the test section."""
+    srs_wkt = qgis_core.QgsCoordinateReferenceSystem(crs).toWkt()
+    ds = gdal.GetDriverByName("GTiff").Create(str(path), size, size, 1, gdal.GDT_Float32)
+    ds.SetGeoTransform((origin[0], pixel, 0, origin[1] + size * pixel, 0, -pixel))
+    ds.SetProjection(srs_wkt)
+    ds.GetRasterBand(1).Fill(100.0)
+    ds.FlushCache()
+    ds = None
+
+
+@pytest.mark.parametrize(
+    ("crs", "start", "end"),
+    [
+        ("EPSG:32633", (500000.0, 5000000.0), (508000.0, 5006000.0)),
+        # Web Mercator, where planar and ellipsoidal distances differ by percents
+        ("EPSG:3857", (1000000.0, 6000000.0), (1008000.0, 6006000.0)),
+    ],
+)
+def test_point_on_line_matches_topographic_station(qgis_app, tmp_path, crs, start, end):
+    """A point on the section gets the station of the topo vertex it sits on."""
+    dem_path = tmp_path / "dem.tif"
+    _write_dem(dem_path, crs, (start[0] - 1000.0, start[1] - 1000.0), 120, 100.0)
+    dem = qgis_core.QgsRasterLayer(str(dem_path), "dem")
+    assert dem.isValid()
+
+    line_crs = qgis_core.QgsCoordinateReferenceSystem(crs)
+    line_start = qgis_core.QgsPointXY(*start)
+    line_geom = qgis_core.QgsGeometry.fromPolylineXY([line_start, qgis_core.QgsPointXY(*end)])
+    distance_area = scu.create_distance_area(line_crs)
+
+    profile = scu.sample_elevation_along_line(
+        line_geom, dem, 1, distance_area, interval=500.0
+    )
+    vertices = scu.get_line_vertices(scu.densify_line_by_interval(line_geom, 500.0))
+    assert len(vertices) == len(profile)
+
+    xy = np.array([(v.x(), v.y()) for v in vertices])
+    dist_along, offset = scu.measure_along_line(xy, line_geom, line_start, distance_area)
+
+    topo_stations = np.array([pt.x() for pt in profile])
+    np.testing.assert_allclose(dist_along, topo_stations, rtol=0, atol=1e-3)
+    np.testing.assert_allclose(offset, 0.0, atol=1e-3)
+
+
+def _bent_line(multipart):
+    """Return a bent section line near the UTM 33N central meridian."""
+    parts = [
+        [(500000.0, 5000000.0), (503000.0, 5004000.0)],
+        [(503000.0, 5004000.0), (508000.0, 5005000.0)],
+    ]
+    if multipart:
+        return qgis_core.QgsGeometry.fromMultiPolylineXY(
+            [[qgis_core.QgsPointXY(*p) for p in part] for part in parts]
+        )
+    return qgis_core.QgsGeometry.fromPolylineXY(
+        [qgis_core.QgsPointXY(*p) for p in parts[0] + parts[1][1:]]
+    )
+
+
+def _scattered_points():
+    """Return points on both sides of the bent line and past its ends."""
+    rng = np.random.default_rng(0)
+    return np.column_stack(
+        [rng.uniform(499000.0, 509000.0, 50), rng.uniform(4999000.0, 5006000.0, 50)]
+    )
+
+
+@pytest.mark.parametrize("multipart", [False, True])
+def test_planar_projection_matches_nearest_point(qgis_app, multipart):
+    """Without an ellipsoid, stations and offsets are planar norms."""
+    distance_area = qgis_core.QgsDistanceArea()
+    distance_area.setSourceCrs(
+        qgis_core.QgsCoordinateReferenceSystem("EPSG:32633"),
+        qgis_core.QgsProject.instance().transformContext(),
+    )
+    distance_area.setEllipsoid("NONE")
+    assert not distance_area.willUseEllipsoid()
+
+    line_geom = _bent_line(multipart)
+    line_start = qgis_core.QgsPointXY(500000.0, 5000000.0)
+    xy = _scattered_points()
+    nearest, dist_along, offset = scu.project_points_to_line(
+        xy, line_geom, line_start, distance_area
+    )
+
+    expected = []
+    for x, y in xy.tolist():
+        point = line_geom.nearestPoint(
+            qgis_core.QgsGeometry.fromPointXY(qgis_core.QgsPointXY(x, y))
+        ).asPoint()
+        expected.append((point.x(), point.y()))
+    expected = np.array(expected)
+    np.testing.assert_allclose(nearest, expected, atol=1e-6)
+    np.testing.assert_allclose(
+        dist_along, np.hypot(*(expected - (line_start.x(), line_start.y())).T), atol=1e-6
+    )
+    np.testing.assert_allclose(offset, np.hypot(*(xy - expected).T), atol=1e-6)
+
+
+def test_ellipsoidal_projection_uses_measure_line(qgis_app):
+    """With the CRS ellipsoid set, distances come from measureLine."""
+    distance_area = scu.create_distance_area(
+        qgis_core.QgsCoordinateReferenceSystem("EPSG:32633")
+    )
+    assert distance_area.willUseEllipsoid()
+
+    line_geom = _bent_line(False)
+    line_start = qgis_core.QgsPointXY(500000.0, 5000000.0)
+    xy = _scattered_points()
+    nearest, dist_along, offset = scu.project_points_to_line(
+        xy, line_geom, line_start, distance_area
+    )
+
+    expected_along = [
+        distance_area.measureLine(line_start, qgis_core.QgsPointXY(nx, ny))
+        for nx, ny in nearest.tolist()
+    ]
+    expected_offset = [
+        distance_area.measureLine(qgis_core.QgsPointXY(x, y), qgis_core.QgsPointXY(nx, ny))
+        for (x, y), (nx, ny) in zip(xy.tolist(), nearest.tolist())
+    ]
+    np.testing.assert_allclose(dist_along, expected_along, atol=1e-6)
+    np.testing.assert_allclose(offset, expected_offset, atol=1e-6)
+    # UTM scale at the central meridian is 0.9996, so planar norms differ
+    planar = np.hypot(*(nearest - (line_start.x(), line_start.y())).T)
+    assert np.abs(dist_along - planar).max() > 1.0